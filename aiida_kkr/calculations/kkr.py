@@ -371,35 +371,39 @@ class KkrCalculation(CalcJob):
             # warning, now this will throw an error
             outfolder = parent_calc.outputs.retrieved
 
+            # resolve the parent's process class only once (entry point lookup)
+            parent_class = parent_calc.process_class
+            outfolder_names = outfolder.list_object_names()
+
             copylist = []
-            if parent_calc.process_class == KkrCalculation:
+            if parent_class is KkrCalculation:
                 copylist = [self._OUT_POTENTIAL]
                 # TODO ggf copy remotely from remote node if present ...
 
-            elif parent_calc.process_class == VoronoiCalculation:
-                copylist = [parent_calc.process_class._SHAPEFUN]
+            elif parent_class is VoronoiCalculation:
+                copylist = [parent_class._SHAPEFUN]
                 # copy either overwrite potential or voronoi output potential
                 # (voronoi caclualtion retreives only one of the two)
-                if parent_calc.process_class._POTENTIAL_IN_OVERWRITE in outfolder.list_object_names():
-                    copylist.append(parent_calc.process_class._POTENTIAL_IN_OVERWRITE)
+                if parent_class._POTENTIAL_IN_OVERWRITE in outfolder_names:
+                    copylist.append(parent_class._POTENTIAL_IN_OVERWRITE)
                 else:
-                    copylist.append(parent_calc.process_class._OUT_POTENTIAL_voronoi)
+                    copylist.append(parent_class._OUT_POTENTIAL_voronoi)
 
             #change copylist in case the calculation starts from an imported calculation
-            else: #if parent_calc.process_class == KkrImporterCalculation:
-                if self._OUT_POTENTIAL in outfolder.list_object_names():
+            else: #if parent_class is KkrImporterCalculation:
+                if self._OUT_POTENTIAL in outfolder_names:
                     copylist.append(self._OUT_POTENTIAL)
                 else:
                     copylist.append(self._POTENTIAL)
-                if self._SHAPEFUN in outfolder.list_object_names():
+                if self._SHAPEFUN in outfolder_names:
                     copylist.append(self._SHAPEFUN)
 
             # create local_copy_list from copylist and change some names automatically
             for file1 in copylist:
                 # deal with special case that file is written to another name
                 if (file1 == 'output.pot' or file1 == self._OUT_POTENTIAL or
-                    (parent_calc.process_class == VoronoiCalculation and
-                     file1 == parent_calc.process_class._POTENTIAL_IN_OVERWRITE) ):
+                    (parent_class is VoronoiCalculation and
+                     file1 == parent_class._POTENTIAL_IN_OVERWRITE) ):
                     filename = self._POTENTIAL
                 else:
                     filename = file1
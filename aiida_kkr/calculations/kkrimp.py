@@ -18,8 +18,9 @@ from aiida_kkr.tools.tools_kkrimp import modify_potential
 from aiida_kkr.tools.tools_kkrimp import make_scoef
 from masci_tools.io.common_functions import search_string
 import os
+import shutil
 import tarfile
-from numpy import array, sqrt, sum, where
+from numpy import array, sqrt, sum
 import six
 from six.moves import range
 
@@ -95,8 +96,25 @@ class KkrimpCalculation(CalcJob):
 
     # name of tarfile which is created by parser after successful parsing (to reduce amount of data stored in repo)
     _FILENAME_TAR = 'output_all.tar.gz'
+    # copy buffer used when extracting from the tarfile (tarfile itself copies in 16 KiB chunks)
+    _TAR_COPYBUFSIZE = 4*1024*1024
     _DIRNAME_GF_UPLOAD = 'kkrflex_green_upload'
 
+    @classmethod
+    def _extract_from_tar(cls, tf, member, path):
+        """
+        Extract `member` (TarInfo or name) of the opened tarfile `tf` to the directory `path`
+        using a copy buffer of size _TAR_COPYBUFSIZE.
+        """
+        if not isinstance(member, tarfile.TarInfo):
+            member = tf.getmember(member)
+        src = tf.extractfile(member)
+        if src is None: # not a regular file, let tarfile handle it
+            tf.extract(member, path)
+            return
+        with open(os.path.join(path, member.name), 'wb') as dst:
+            shutil.copyfileobj(src, dst, cls._TAR_COPYBUFSIZE)
+
     @classmethod
     def define(cls,spec):
         """
@@ -502,7 +520,7 @@ class KkrimpCalculation(CalcJob):
             rtmp = Rimp_rel_list[iatom]
             diff = sqrt(sum((rtmp-scoef)**2, axis=1))
             Zimp = Zimp_list[iatom]
-            ipos_replace = where(diff==diff.min())[0][0]
+            ipos_replace = diff.argmin() # first position of the minimal distance
             replace_zatom_imp.append([ipos_replace, Zimp])
 
         for (iatom, zimp) in replace_zatom_imp:
@@ -556,17 +574,16 @@ class KkrimpCalculation(CalcJob):
             self.logger.info('potfile {} {}'.format(retrieved, self._OUT_POTENTIAL))
 
             # extract file from host's tarball (extract to tempfolder and use from there, this way the unnessesary files are deleted once submission is done)
-            tar_filenames = []
             if self._FILENAME_TAR in retrieved.list_object_names():
                 # get path of tarfile
                 with retrieved.open(self._FILENAME_TAR) as tf:
                     tfpath = tf.name
                 # extract file from tarfile of retrieved to tempfolder
                 with tarfile.open(tfpath) as tf:
-                    tar_filenames = [ifile.name for ifile in tf.getmembers()]
-                    filename = self._OUT_POTENTIAL
-                    if filename in tar_filenames:
-                        tf.extract(filename, tempfolder_path) # extract to tempfolder
+                    try:
+                        self._extract_from_tar(tf, self._OUT_POTENTIAL, tempfolder_path) # extract to tempfolder
+                    except KeyError:
+                        pass # no out_potential in tarfile
             else: # otherwise copy from retrieved to tempfolder (rest of calculation needs files to be in tempfolder)
                 filename = self._OUT_POTENTIAL
                 if filename in retrieved.list_object_names():
@@ -5,13 +5,15 @@ Input plug-in for a voronoi calculation.
 from __future__ import print_function
 from __future__ import absolute_import
 from aiida.engine import CalcJob
-from aiida.orm import CalcJobNode
 from aiida.common.utils import classproperty
 from aiida.common.exceptions import (InputValidationError, ValidationError)
 from aiida.common.datastructures import (CalcInfo, CodeInfo)
 from aiida.plugins import DataFactory
-from aiida_kkr.tools.common_workfunctions import generate_inputcard_from_structure, check_2Dinput_consistency, vca_check
+from aiida_kkr.tools.common_workfunctions import generate_inputcard_from_structure, check_2Dinput_consistency, vca_check, _get_parent_calcs
 from aiida.common.exceptions import UniquenessError, NotExistent
+from aiida.orm import load_node
+from functools import wraps
+from collections import OrderedDict
 import os
 import six
 
@@ -54,6 +56,8 @@ class VoronoiCalculation(CalcJob):
     _VERTICES = 'vertices.dat'
     _OUT_POTENTIAL_voronoi = 'output.pot'
     _POTENTIAL_IN_OVERWRITE = 'overwrite_potential'
+    # files that are always retrieved
+    _BASE_RETRIEVE = (_OUTPUT_FILE_NAME, _ATOMINFO, _RADII, _SHAPEFUN, _VERTICES, _INPUT_FILE_NAME)
 
     @classmethod
     def define(cls, spec):
@@ -85,8 +89,9 @@ class VoronoiCalculation(CalcJob):
         :param tempfolder: an `aiida.common.folders.Folder` to temporarily write files on disk
         :return: `aiida.common.datastructures.CalcInfo` instance
         """
-        # Check inputdict
-        parameters = self.inputs.parameters
+        # Check inputdict (get dictionary only once from the database)
+        param_dict = self.inputs.parameters.get_dict()
+        use_alat_input = param_dict.get('use_input_alat', False)
 
         if 'structure' in self.inputs:
             structure = self.inputs.structure
@@ -97,7 +102,7 @@ class VoronoiCalculation(CalcJob):
         vca_structure = False
         if found_structure:
             # for VCA: check if input structure and parameter node define VCA structure
-            vca_structure = vca_check(structure, parameters)
+            vca_structure = vca_check(structure, param_dict)
 
         code = self.inputs.code
 
@@ -145,15 +150,14 @@ class VoronoiCalculation(CalcJob):
 
         ###################################
         # Check for 2D case
-        twoDimcheck, msg = check_2Dinput_consistency(structure, parameters)
+        twoDimcheck, msg = check_2Dinput_consistency(structure, param_dict)
         if not twoDimcheck:
             raise InputValidationError(msg)
 
         # Prepare inputcard from Structure and input parameter data
         input_file = tempfolder.open(self._INPUT_FILE_NAME, u'w')
         try:
-            use_alat_input = parameters.get_dict().get('use_input_alat', False)
-            natom, nspin, newsosol, warnings_write_inputcard = generate_inputcard_from_structure(parameters, structure, input_file, isvoronoi=True, vca_structure=vca_structure, use_input_alat=use_alat_input)
+            natom, nspin, newsosol, warnings_write_inputcard = generate_inputcard_from_structure(param_dict, structure, input_file, isvoronoi=True, vca_structure=vca_structure, use_input_alat=use_alat_input)
         except ValueError as e:
             raise InputValidationError("Input Dict not consistent: {}".format(e))
 
@@ -171,9 +175,11 @@ class VoronoiCalculation(CalcJob):
             else:
                 copylist = []
 
-            for file1 in copylist:
+            # the first file is renamed to the overwrite potential
+            rename_first = found_parent or has_potfile_overwrite
+            for ifile, file1 in enumerate(copylist):
                 filename = file1
-                if (found_parent or has_potfile_overwrite) and file1 == copylist[0]:
+                if rename_first and ifile == 0:
                     filename = self._POTENTIAL_IN_OVERWRITE
                 local_copy_list.append((outfolder.uuid, file1, filename))
 
@@ -182,17 +188,15 @@ class VoronoiCalculation(CalcJob):
         calcinfo.uuid = self.uuid
         calcinfo.local_copy_list = local_copy_list
         calcinfo.remote_copy_list = []
-        calcinfo.retrieve_list = [self._OUTPUT_FILE_NAME, self._ATOMINFO,
-                                  self._RADII, self._SHAPEFUN, self._VERTICES,
-                                  self._INPUT_FILE_NAME]
+        calcinfo.retrieve_list = list(self._BASE_RETRIEVE)
 
         # pass on overwrite potential if this was given in input
         # (KkrCalculation checks if this file is there and takes this file instead of _OUT_POTENTIAL_voronoi
         #  if given)
         if overwrite_potential:
-            calcinfo.retrieve_list += [self._POTENTIAL_IN_OVERWRITE]
+            calcinfo.retrieve_list.append(self._POTENTIAL_IN_OVERWRITE)
         else:
-            calcinfo.retrieve_list += [self._OUT_POTENTIAL_voronoi]
+            calcinfo.retrieve_list.append(self._OUT_POTENTIAL_voronoi)
 
         codeinfo = CodeInfo()
         codeinfo.cmdline_params = []
@@ -210,15 +214,16 @@ class VoronoiCalculation(CalcJob):
         """
         overwrite_pot = False
 
-        # extract parent calculation
-        parent_calcs = parent_calc_folder.get_incoming(node_class=CalcJobNode)
-        n_parents = len(parent_calcs.all_link_labels())
+        # extract parent calculation (two results are enough to know that the parent is not unique)
+        parent_calcs = _get_parent_calcs(parent_calc_folder)
+        n_parents = len(parent_calcs)
         if n_parents != 1:
             raise UniquenessError("Input RemoteData is child of {} "
                                   "calculation{}, while it should have a single parent"
-                                  "".format(n_parents, "" if n_parents == 0 else "s"))
+                                  "".format("no" if n_parents == 0 else "more than one",
+                                            "s" if n_parents == 0 else ""))
         else:
-            parent_calc = parent_calcs.first().node
+            parent_calc = parent_calcs[0]
             overwrite_pot = True
 
         if ((not self._is_KkrCalc(parent_calc)) ):
@@ -231,12 +236,7 @@ class VoronoiCalculation(CalcJob):
         """
         check if calc contains the file out_potential
         """
-        is_KKR = False
-        retrieved_node = calc.get_retrieved_node()
-        if 'out_potential' in retrieved_node.list_object_names():
-            is_KKR = True
-
-        return is_KKR
+        return _retrieved_has_out_potential(calc.get_retrieved_node().uuid)
 
 
     @classmethod
@@ -292,15 +292,55 @@ class VoronoiCalculation(CalcJob):
         """
         Find the Structure node recuresively in chain of parent calculations (structure node is input to voronoi calculation)
         """
-        iiter = 0
-        Nmaxiter = 1000
-        parent_folder_tmp = self._get_remote(parent_folder)
-        while not self._has_struc(parent_folder_tmp) and iiter<Nmaxiter:
-            parent_folder_tmp = self._get_remote(self._get_parent(parent_folder_tmp))
-            iiter += 1
-            if iiter%200==0: print('Warning: find_parent_structure takes quite long (already searched {} ancestors). Stop after {}'.format(iiter, Nmaxiter))
-        if self._has_struc(parent_folder_tmp):
-            struc = self._get_struc(parent_folder_tmp)
-            return struc, parent_folder_tmp
-        else:
-            raise ValueError("structure not found".format(parent_folder_tmp0))
+        struc_uuid, voro_parent_uuid = _resolve_structure_uuid(parent_folder.uuid)
+        return load_node(struc_uuid), load_node(voro_parent_uuid)
+
+
+def _uuid_cache(maxsize=None):
+    """
+    Memoize a function that takes a single uuid as argument (python 2 compatible replacement of lru_cache).
+    At most `maxsize` results are kept (unbounded if None), the oldest entry is evicted first.
+    The cache can be emptied with `func.cache_clear()`.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        @wraps(func)
+        def wrapper(uuid):
+            if uuid not in cache:
+                cache[uuid] = func(uuid)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return cache[uuid]
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+@_uuid_cache(maxsize=4096)
+def _retrieved_has_out_potential(ret_uuid):
+    """
+    check if the retrieved folder with uuid `ret_uuid` contains the file out_potential
+    (cached since the content of a stored retrieved folder does not change)
+    """
+    return 'out_potential' in load_node(ret_uuid).list_object_names()
+
+
+@_uuid_cache(maxsize=1024)
+def _resolve_structure_uuid(parent_uuid):
+    """
+    Walk the chain of parent calculations starting at the node with uuid `parent_uuid` and return the uuids
+    of the structure and of the node (calculation or workflow) that has this structure as input.
+    Results are cached since provenance of stored nodes does not change.
+    """
+    iiter = 0
+    Nmaxiter = 1000
+    parent_folder_tmp = VoronoiCalculation._get_remote(load_node(parent_uuid))
+    while not VoronoiCalculation._has_struc(parent_folder_tmp) and iiter<Nmaxiter:
+        parent_folder_tmp = VoronoiCalculation._get_remote(VoronoiCalculation._get_parent(parent_folder_tmp))
+        iiter += 1
+        if iiter%200==0: print('Warning: find_parent_structure takes quite long (already searched {} ancestors). Stop after {}'.format(iiter, Nmaxiter))
+    if VoronoiCalculation._has_struc(parent_folder_tmp):
+        struc = VoronoiCalculation._get_struc(parent_folder_tmp)
+        return struc.uuid, parent_folder_tmp.uuid
+    else:
+        raise ValueError("structure not found")
@@ -13,9 +13,13 @@ def aiida_env():
 
 @pytest.fixture()
 def fresh_aiida_env(aiida_env):
+    from aiida_kkr.calculations.voro import _resolve_structure_uuid, _retrieved_has_out_potential
     aiida_env.reset_db()
     yield
     aiida_env.reset_db()
+    # cached uuids point to nodes that are gone after the reset
+    _resolve_structure_uuid.cache_clear()
+    _retrieved_has_out_potential.cache_clear()
 
 
 # for computers and codes
@@ -23,17 +23,13 @@ def prepare_computer(computername, workdir):
     from aiida.orm import Computer
     from aiida.orm.querybuilder import QueryBuilder
 
-    # first check if computer exists already in database
+    # first check if computer exists already in database (let the database do the name lookup)
     qb = QueryBuilder()
-    qb.append(Computer, tag='computer')
-    all_computers = qb.dict()
-    computer_found_in_db = False
-    if len(all_computers)>0:
-        for icomp in range(len(all_computers)):
-            c = all_computers[icomp].get('computer').get('*')
-            if c.get_name() == computername:
-                computer_found_in_db = True
-                comp = c
+    qb.append(Computer, filters={'name': computername})
+    found = qb.first()
+    computer_found_in_db = found is not None
+    if computer_found_in_db:
+        comp = found[0]
     # if it is not there create a new one
     if not computer_found_in_db:
         #comp = Computer(computername, 'test computer', transport_type='local', scheduler_type='direct', workdir=workdir)
@@ -50,9 +46,7 @@ def prepare_computer(computername, workdir):
 
 def prepare_code(codename, codelocation, computername, workdir):
     """."""
-    # first create or read computer
-    comp = prepare_computer(computername, workdir)
-    # now decide which code to add
+    # decide which code to add
     if codename == 'kkrhost':
         execname = 'kkr.x'
         pluginname = 'kkr.kkr'
@@ -70,6 +64,8 @@ def prepare_code(codename, codelocation, computername, workdir):
     try:
         code = Code.get_from_string(codename+'@'+computername)
     except NotExistent as exception:
+        # create or read computer only if the code needs to be created
+        comp = prepare_computer(computername, workdir)
         code = Code()
         code.label = codename
         code.description = ''
@@ -7,7 +7,6 @@ from __future__ import absolute_import
 from builtins import object
 import pytest
 from six.moves import range
-from numpy import sort
 
 @pytest.mark.usefixtures("aiida_env")
 class Test_common_workfunctions(object):
@@ -70,61 +69,31 @@ class Test_common_workfunctions(object):
             assert set(txt2[i].split())==set(ref[i].split())
 
 
-    def test_check_2Dinput_consistency_1(self):
+    @pytest.mark.parametrize('pbc, params, check_ok, msg', [
         # case 1: 3D structure and no 2D params input
-        from aiida_kkr.tools.common_workfunctions import check_2Dinput_consistency
-        from aiida.plugins import DataFactory
-        StructureData = DataFactory('structure')
-        Dict = DataFactory('dict')
-        s = StructureData(cell=[[0.5, 0.5, 0], [1,0,0], [0,0,1]])
-        s.append_atom(position=[0,0,0], symbols='Fe')
-        p = Dict(dict={'INTERFACE':False})
-        input_check = check_2Dinput_consistency(s, p)
-        assert input_check[0]
-        assert input_check[1] == '2D consistency check complete'
-
-    def test_check_2Dinput_consistency_2(self):
+        ((True, True, True), {'INTERFACE':False}, True, '2D consistency check complete'),
         # case 2: 2D structure and 2D params input
-        from aiida_kkr.tools.common_workfunctions import check_2Dinput_consistency
-        from aiida.plugins import DataFactory
-        StructureData = DataFactory('structure')
-        Dict = DataFactory('dict')
-        s = StructureData(cell=[[0.5, 0.5, 0], [1,0,0], [0,0,1]])
-        s.append_atom(position=[0,0,0], symbols='Fe')
-        s.set_pbc((True, True, False))
-        p = Dict(dict={'INTERFACE':True, '<NRBASIS>':1, '<RBLEFT>':[0,0,0], '<RBRIGHT>':[0,0,0], 'ZPERIODL':[0,0,0], 'ZPERIODR':[0,0,0], '<NLBASIS>':1})
-        input_check = check_2Dinput_consistency(s, p)
-        assert input_check[0]
-        assert input_check[1] == "2D consistency check complete"
-
-    def test_check_2Dinput_consistency_3(self):
+        ((True, True, False), {'INTERFACE':True, '<NRBASIS>':1, '<RBLEFT>':[0,0,0], '<RBRIGHT>':[0,0,0], 'ZPERIODL':[0,0,0], 'ZPERIODR':[0,0,0], '<NLBASIS>':1},
+         True, "2D consistency check complete"),
         # case 3: 2D structure but incomplete 2D input parameters given
+        ((True, True, False), {'INTERFACE':True, '<NRBASIS>':1,},
+         False, "2D info given in parameters but structure is 3D\nstructure is 2D? {}\ninput has 2D info? {}\nset keys are: {}".format(True, False, ['INTERFACE', '<NRBASIS>'])),
+        # case 4: 2D structure but interface parameter set to False
+        ((True, True, False), {'INTERFACE':False, '<NRBASIS>':1, '<RBLEFT>':[0,0,0], '<RBRIGHT>':[0,0,0], 'ZPERIODL':[0,0,0], 'ZPERIODR':[0,0,0], '<NLBASIS>':1},
+         False, "'INTERFACE' parameter set to False but structure is 2D"),
+    ])
+    def test_check_2Dinput_consistency(self, pbc, params, check_ok, msg):
         from aiida_kkr.tools.common_workfunctions import check_2Dinput_consistency
         from aiida.plugins import DataFactory
         StructureData = DataFactory('structure')
         Dict = DataFactory('dict')
         s = StructureData(cell=[[0.5, 0.5, 0], [1,0,0], [0,0,1]])
         s.append_atom(position=[0,0,0], symbols='Fe')
-        s.set_pbc((True, True, False))
-        p = Dict(dict={'INTERFACE':True, '<NRBASIS>':1,})
-        input_check = check_2Dinput_consistency(s, p)
-        assert not input_check[0]
-        assert input_check[1] == "2D info given in parameters but structure is 3D\nstructure is 2D? {}\ninput has 2D info? {}\nset keys are: {}".format(True, False, ['INTERFACE', '<NRBASIS>'])
-
-
-    def test_check_2Dinput_consistency_4(self):
-        # case 3: 2D structure but interface parameter set to False
-        from aiida_kkr.tools.common_workfunctions import check_2Dinput_consistency
-        from aiida.plugins import DataFactory
-        StructureData = DataFactory('structure')
-        Dict = DataFactory('dict')
-        s = StructureData(cell=[[0.5, 0.5, 0], [1,0,0], [0,0,1]])
-        s.append_atom(position=[0,0,0], symbols='Fe')
-        s.set_pbc((True, True, False))
-        p = Dict(dict={'INTERFACE':False, '<NRBASIS>':1, '<RBLEFT>':[0,0,0], '<RBRIGHT>':[0,0,0], 'ZPERIODL':[0,0,0], 'ZPERIODR':[0,0,0], '<NLBASIS>':1})
+        s.set_pbc(pbc)
+        p = Dict(dict=params)
         input_check = check_2Dinput_consistency(s, p)
-        assert not input_check[0]
-        assert input_check[1] == "'INTERFACE' parameter set to False but structure is 2D"
+        assert input_check[0] == check_ok
+        assert input_check[1] == msg
 
     def test_check_2Dinput_consistency_5(self):
         # case 5: 3D structure but 2D params given
@@ -138,7 +107,7 @@ class Test_common_workfunctions(object):
         p = Dict(dict={'INTERFACE':True, '<NRBASIS>':1, '<RBLEFT>':[0,0,0], '<RBRIGHT>':[0,0,0], 'ZPERIODL':[0,0,0], 'ZPERIODR':[0,0,0], '<NLBASIS>':1})
         input_check = check_2Dinput_consistency(s, p)
         assert not input_check[0]
-        assert list(input_check[1]).sort() == list("3D info given in parameters but structure is 2D\nstructure is 2D? {}\ninput has 2D info? {}\nset keys are: {}".format(False, True, ['ZPERIODL', '<NRBASIS>', '<RBLEFT>', 'INTERFACE', '<NLBASIS>', 'ZPERIODR', '<RBRIGHT>'])).sort()
+        assert sorted(input_check[1]) == sorted("3D info given in parameters but structure is 2D\nstructure is 2D? {}\ninput has 2D info? {}\nset keys are: {}".format(False, True, ['ZPERIODL', '<NRBASIS>', '<RBLEFT>', 'INTERFACE', '<NLBASIS>', 'ZPERIODR', '<RBRIGHT>']))
 
 
     def test_vca_check(self):
@@ -7,7 +7,6 @@ from __future__ import absolute_import
 from builtins import object
 import pytest
 from six.moves import range
-from numpy import sort
 
 @pytest.mark.usefixtures("aiida_env")
 class Test_common_workfunctions_rmq(object):
@@ -53,8 +52,7 @@ class Test_common_workfunctions_rmq(object):
                 l_diff.append([1, i, d1[i]])
 
         assert l_identical ==  [[u'LMAX', 2, 2]]
-        assert l_diff.sort() == [[1, u'RMAX', 10.0], [1, u'EMIN', -1.0]].sort()
-        return node1, node2, unode
+        assert sorted(l_diff) == sorted([[1, u'RMAX', 10.0], [1, u'EMIN', -1.0]])
 
 
     def test_neworder_potential_wf(self):
@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-#import pytest
 from __future__ import print_function
 from __future__ import absolute_import
 from builtins import object
+import os
+import json
+import pytest
 from aiida_kkr.tools.tools_kkrimp import modify_potential, kkrimp_parser_functions
 from masci_tools.io.common_functions import open_general
 
+# test files are found relative to this module, independent of the working directory
+_files_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'files')
+
 class Test_modify_potential(object):
     """ Tests for the modify_potential class functions. """
 
-    def test_neworder_potential_filehandle(self):
-        pot1 = 'files/kkr/kkr_run_slab_nosoc/out_potential'
-        pot_out1 = 'test_pot1'
-        pot_out2 = 'test_pot2'
-        pot_out3 = 'test_pot3'
-        pot_out4 = 'test_pot4'
+    def test_neworder_potential_filehandle(self, tmpdir):
+        pot1 = os.path.join(_files_dir, 'kkr', 'kkr_run_slab_nosoc', 'out_potential')
+        pot_out1 = str(tmpdir.join('test_pot1'))
+        pot_out2 = str(tmpdir.join('test_pot2'))
+        pot_out3 = str(tmpdir.join('test_pot3'))
+        pot_out4 = str(tmpdir.join('test_pot4'))
         pot1_fh = open_general(pot1)
         pot_out_fh3 = open_general(pot_out3, 'w')
         pot_out_fh4 = open_general(pot_out4, 'w')
@@ -42,21 +47,21 @@ class Test_modify_potential(object):
         assert po1==po3
         assert po1==po4
 
-    def test_shapefun_from_scoef(self):
-        shapefun_path = '../tests/files/mod_pot/test2/shapefun'
-        scoefpath = '../tests/files/mod_pot/test2/scoef'
+    def test_shapefun_from_scoef(self, tmpdir):
+        shapefun_path = os.path.join(_files_dir, 'mod_pot', 'test2', 'shapefun')
+        scoefpath = os.path.join(_files_dir, 'mod_pot', 'test2', 'scoef')
         atom2shapes = [1]
-        shapefun_new = '../tests/files/mod_pot/test2/shapefun_new'
+        shapefun_new = str(tmpdir.join('shapefun_new'))
         modify_potential().shapefun_from_scoef(scoefpath, shapefun_path, atom2shapes, shapefun_new)
         reftxt = ['   7\n', '  1.000000000000E+00\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n', '    3  135 NPAN,MESHN;  Shape number     1;     # serial: voro_v1.0-16-g2d2b8f1_serial_20180516213647\n', '   10   70   55\n', '  0.495000000000D+00  0.555555555556D-03  0.495555555556D+00  0.555555555556D-03\n', '  0.496111111111D+00  0.555555555556D-03  0.496666666667D+00  0.555555555556D-03\n', '  0.497222222222D+00  0.555555555556D-03  0.497777777778D+00  0.555555555556D-03\n', '  0.498333333333D+00  0.555555555556D-03  0.498888888889D+00  0.555555555556D-03\n', '  0.499444444444D+00  0.555555555556D-03  0.500000000000D+00  0.555555555556D-03\n', '  0.500000000000D+00  0.300154755343D-02  0.503001547553D+00  0.300154755343D-02\n', '  0.506003095107D+00  0.300154755343D-02  0.509004642660D+00  0.300154755343D-02\n', '  0.512006190214D+00  0.300154755343D-02  0.515007737767D+00  0.300154755343D-02\n', '  0.518009285321D+00  0.300154755343D-02  0.521010832874D+00  0.300154755343D-02\n', '  0.524012380427D+00  0.300154755343D-02  0.527013927981D+00  0.300154755343D-02\n', '  0.530015475534D+00  0.300154755343D-02  0.533017023088D+00  0.300154755343D-02\n', '  0.536018570641D+00  0.300154755343D-02  0.539020118195D+00  0.300154755343D-02\n', '  0.542021665748D+00  0.300154755343D-02  0.545023213301D+00  0.300154755343D-02\n', '  0.548024760855D+00  0.300154755343D-02  0.551026308408D+00  0.300154755343D-02\n', '  0.554027855962D+00  0.300154755343D-02  0.557029403515D+00  0.300154755343D-02\n', '  0.560030951069D+00  0.300154755343D-02  0.563032498622D+00  0.300154755343D-02\n', '  0.566034046175D+00  0.300154755343D-02  0.569035593729D+00  0.300154755343D-02\n', '  0.572037141282D+00  0.300154755343D-02  0.575038688836D+00  0.300154755343D-02\n', '  0.578040236389D+00  0.300154755343D-02  0.581041783943D+00  0.300154755343D-02\n', '  0.584043331496D+00  0.300154755343D-02  0.587044879049D+00  0.300154755343D-02\n', '  0.590046426603D+00  0.300154755343D-02  0.593047974156D+00  0.300154755343D-02\n', '  0.596049521710D+00  0.300154755343D-02  0.599051069263D+00  0.300154755343D-02\n', '  0.602052616817D+00  0.300154755343D-02  0.605054164370D+00  0.300154755343D-02\n', '  0.608055711923D+00  0.300154755343D-02  0.611057259477D+00  0.300154755343D-02\n', '  0.614058807030D+00  0.300154755343D-02  0.617060354584D+00  0.300154755343D-02\n', '  0.620061902137D+00  0.300154755343D-02  0.623063449691D+00  0.300154755343D-02\n', '  0.626064997244D+00  0.300154755343D-02  0.629066544797D+00  0.300154755343D-02\n', '  0.632068092351D+00  0.300154755343D-02  0.635069639904D+00  0.300154755343D-02\n', '  0.638071187458D+00  0.300154755343D-02  0.641072735011D+00  0.300154755343D-02\n', '  0.644074282565D+00  0.300154755343D-02  0.647075830118D+00  0.300154755343D-02\n', '  0.650077377671D+00  0.300154755343D-02  0.653078925225D+00  0.300154755343D-02\n', '  0.656080472778D+00  0.300154755343D-02  0.659082020332D+00  0.300154755343D-02\n', '  0.662083567885D+00  0.300154755343D-02  0.665085115439D+00  0.300154755343D-02\n', '  0.668086662992D+00  0.300154755343D-02  0.671088210545D+00  0.300154755343D-02\n', '  0.674089758099D+00  0.300154755343D-02  0.677091305652D+00  0.300154755343D-02\n', '  0.680092853206D+00  0.300154755343D-02  0.683094400759D+00  0.300154755343D-02\n', '  0.686095948313D+00  0.300154755343D-02  0.689097495866D+00  0.300154755343D-02\n', '  0.692099043419D+00  0.300154755343D-02  0.695100590973D+00  0.300154755343D-02\n', '  0.698102138526D+00  0.300154755343D-02  0.701103686080D+00  0.300154755343D-02\n', '  0.704105233633D+00  0.300154755343D-02  0.707106781187D+00  0.300154755343D-02\n', '  0.707106781187D+00  0.294293745552D-02  0.710049718642D+00  0.294293745552D-02\n', '  0.712992656098D+00  0.294293745552D-02  0.715935593553D+00  0.294293745552D-02\n', '  0.718878531009D+00  0.294293745552D-02  0.721821468464D+00  0.294293745552D-02\n', '  0.724764405920D+00  0.294293745552D-02  0.727707343375D+00  0.294293745552D-02\n', '  0.730650280831D+00  0.294293745552D-02  0.733593218286D+00  0.294293745552D-02\n', '  0.736536155742D+00  0.294293745552D-02  0.739479093197D+00  0.294293745552D-02\n', '  0.742422030653D+00  0.294293745552D-02  0.745364968108D+00  0.294293745552D-02\n', '  0.748307905564D+00  0.294293745552D-02  0.751250843019D+00  0.294293745552D-02\n', '  0.754193780475D+00  0.294293745552D-02  0.757136717930D+00  0.294293745552D-02\n', '  0.760079655386D+00  0.294293745552D-02  0.763022592841D+00  0.294293745552D-02\n', '  0.765965530297D+00  0.294293745552D-02  0.768908467752D+00  0.294293745552D-02\n', '  0.771851405208D+00  0.294293745552D-02  0.774794342663D+00  0.294293745552D-02\n', '  0.777737280119D+00  0.294293745552D-02  0.780680217574D+00  0.294293745552D-02\n', '  0.783623155030D+00  0.294293745552D-02  0.786566092485D+00  0.294293745552D-02\n', '  0.789509029941D+00  0.294293745552D-02  0.792451967397D+00  0.294293745552D-02\n', '  0.795394904852D+00  0.294293745552D-02  0.798337842308D+00  0.294293745552D-02\n', '  0.801280779763D+00  0.294293745552D-02  0.804223717219D+00  0.294293745552D-02\n', '  0.807166654674D+00  0.294293745552D-02  0.810109592130D+00  0.294293745552D-02\n', '  0.813052529585D+00  0.294293745552D-02  0.815995467041D+00  0.294293745552D-02\n', '  0.818938404496D+00  0.294293745552D-02  0.821881341952D+00  0.294293745552D-02\n', '  0.824824279407D+00  0.294293745552D-02  0.827767216863D+00  0.294293745552D-02\n', '  0.830710154318D+00  0.294293745552D-02  0.833653091774D+00  0.294293745552D-02\n', '  0.836596029229D+00  0.294293745552D-02  0.839538966685D+00  0.294293745552D-02\n', '  0.842481904140D+00  0.294293745552D-02  0.845424841596D+00  0.294293745552D-02\n', '  0.848367779051D+00  0.294293745552D-02  0.851310716507D+00  0.294293745552D-02\n', '  0.854253653962D+00  0.294293745552D-02  0.857196591418D+00  0.294293745552D-02\n', '  0.860139528873D+00  0.294293745552D-02  0.863082466329D+00  0.294293745552D-02\n', '  0.866025403784D+00  0.294293745552D-02\n', '    8\n', '    1\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01\n', '  0.354490770181D+01  0.354490770181D+01  0.354490770181D+01  0.348144740577D+01\n', '  0.341873998692D+01  0.335677212636D+01  0.329553081748D+01  0.323500335691D+01\n', '  0.317517733570D+01  0.311604063086D+01  0.305758139715D+01  0.299978805921D+01\n', '  0.294264930386D+01  0.288615407276D+01  0.283029155528D+01  0.277505118156D+01\n', '  0.272042261588D+01  0.266639575022D+01  0.261296069799D+01  0.256010778802D+01\n', '  0.250782755873D+01  0.245611075245D+01  0.240494831001D+01  0.235433136540D+01\n', '  0.230425124068D+01  0.225469944100D+01  0.220566764980D+01  0.215714772417D+01\n', '  0.210913169033D+01  0.206161173925D+01  0.201458022246D+01  0.196802964790D+01\n', '  0.192195267594D+01  0.187634211556D+01  0.183119092059D+01  0.178649218608D+01\n', '  0.174223914475D+01  0.169842516366D+01  0.165504374078D+01  0.161208850186D+01\n', '  0.156955319730D+01  0.152743169906D+01  0.148571799778D+01  0.144440619990D+01\n', '  0.140349052487D+01  0.136296530248D+01  0.132282497020D+01  0.128306407070D+01\n', '  0.124367724929D+01  0.120465925162D+01  0.116600492124D+01  0.112770919739D+01\n', '  0.108976711279D+01  0.105217379146D+01  0.101492444666D+01  0.978014378839D+00\n', '  0.941438973679D+00  0.905193700153D+00  0.869274108662D+00  0.833675829215D+00\n', '  0.798394569651D+00  0.763426113922D+00  0.728766320407D+00  0.694411120278D+00\n', '  0.660356515910D+00  0.626598579329D+00  0.593133450700D+00  0.559957336859D+00\n', '  0.527066509878D+00  0.494457305668D+00  0.462126122617D+00  0.430069420271D+00\n', '  0.430069420271D+00  0.402303316540D+00  0.377539313460D+00  0.354743340664D+00\n', '  0.333530457006D+00  0.313670769379D+00  0.295004615108D+00  0.277411710302D+00\n', '  0.260796664908D+00  0.245081108278D+00  0.230198970219D+00  0.216093447552D+00\n', '  0.202714947697D+00  0.190019635093D+00  0.177968368454D+00  0.166525901810D+00\n', '  0.155660269630D+00  0.145342304080D+00  0.135545249448D+00  0.126244449527D+00\n', '  0.117417090804D+00  0.109041989005D+00  0.101099409844D+00  0.935709170764D-01\n', '  0.864392426117D-01  0.796881746491D-01  0.733024606555D-01  0.672677226928D-01\n', '  0.615703830911D-01  0.561975988595D-01  0.511372035220D-01  0.463776553057D-01\n', '  0.419079907936D-01  0.377177833043D-01  0.337971053812D-01  0.301364948711D-01\n', '  0.267269241521D-01  0.235597721351D-01  0.206267987196D-01  0.179201214265D-01\n', '  0.154321939709D-01  0.131557865685D-01  0.110839677947D-01  0.921008784091D-02\n', '  0.752776303004D-02  0.603086146903D-02  0.471348973284D-02  0.356998048451D-02\n', '  0.259488094746D-02  0.178294215513D-02  0.112910891116D-02  0.628510400363D-03\n', '  0.276451396771D-03  0.684040205092D-04  0.457411886146D-13\n', '   21\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.107771580765D+00\n', ' -0.207927768303D+00 -0.300879928222D+00 -0.387017301583D+00 -0.466708260187D+00\n', ' -0.540301485561D+00 -0.608127076621D+00 -0.670497590656D+00 -0.727709021934D+00\n', ' -0.780041721948D+00 -0.827761265034D+00 -0.871119262839D+00 -0.910354130889D+00\n', ' -0.945691810260D+00 -0.977346447194D+00 -0.100552103326D+01 -0.103040800855D+01\n', ' -0.105218983014D+01 -0.107103950802D+01 -0.108712111043D+01 -0.110059024054D+01\n', ' -0.111159448612D+01 -0.112027384388D+01 -0.112676112010D+01 -0.113118230872D+01\n', ' -0.113365694857D+01 -0.113429846067D+01 -0.113321446694D+01 -0.113050709147D+01\n', ' -0.112627324514D+01 -0.112060489489D+01 -0.111358931816D+01 -0.110530934371D+01\n', ' -0.109584357938D+01 -0.108526662757D+01 -0.107364928929D+01 -0.106105875719D+01\n', ' -0.104755879842D+01 -0.103320992775D+01 -0.101806957159D+01 -0.100219222331D+01\n', ' -0.985629590493D+00 -0.968430734425D+00 -0.950642202363D+00 -0.932308152903D+00\n', ' -0.913470474873D+00 -0.894168900091D+00 -0.874441110314D+00 -0.854322838707D+00\n', ' -0.833847966132D+00 -0.813048612513D+00 -0.791955223572D+00 -0.770596653163D+00\n', ' -0.749000241447D+00 -0.727191889129D+00 -0.705196127964D+00 -0.683036187733D+00\n', ' -0.660734059870D+00 -0.638310557917D+00 -0.615785374981D+00 -0.593177138329D+00\n', ' -0.570503461300D+00 -0.547780992645D+00 -0.525025463440D+00 -0.502251731701D+00\n', ' -0.479473824810D+00 -0.456704979869D+00 -0.433957682089D+00 -0.411243701307D+00\n', ' -0.411243701307D+00 -0.390528872452D+00 -0.371153728294D+00 -0.352708702956D+00\n', ' -0.335055250348D+00 -0.318115790182D+00 -0.301838817656D+00 -0.286186587040D+00\n', ' -0.271129514420D+00 -0.256643242282D+00 -0.242706948687D+00 -0.229302306517D+00\n', ' -0.216412810451D+00 -0.204023324895D+00 -0.192119771086D+00 -0.180688905193D+00\n', ' -0.169718157817D+00 -0.159195515938D+00 -0.149109434868D+00 -0.139448771777D+00\n', ' -0.130202734970D+00 -0.121360844815D+00 -0.112912903371D+00 -0.104848970587D+00\n', ' -0.971593454900D-01 -0.898345511834D-01 -0.828653227895D-01 -0.762425976473D-01\n', ' -0.699575072669D-01 -0.640013706413D-01 -0.583656886141D-01 -0.530421390663D-01\n', ' -0.480225727376D-01 -0.432990095404D-01 -0.388636352520D-01 -0.347087984988D-01\n', ' -0.308270079625D-01 -0.272109297547D-01 -0.238533849179D-01 -0.207473470199D-01\n', ' -0.178859398176D-01 -0.152624349680D-01 -0.128702497753D-01 -0.107029449600D-01\n', ' -0.875422244382D-02 -0.701792314373D-02 -0.548802477161D-02 -0.415863963680D-02\n', ' -0.302401245044D-02 -0.207851813067D-02 -0.131665960939D-02 -0.733065640768D-03\n', ' -0.322488612760D-03 -0.798023629498D-04 -0.130951788091D-13\n', '   25\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.910836100221D-01\n', ' -0.175731038058D+00 -0.254289951499D+00 -0.327089319087D+00 -0.394440471814D+00\n', ' -0.456638099358D+00 -0.513961186222D+00 -0.566673891528D+00 -0.615026376092D+00\n', ' -0.659255580170D+00 -0.699585955043D+00 -0.736230151364D+00 -0.769389667030D+00\n', ' -0.799255457103D+00 -0.826008508190D+00 -0.849820379482D+00 -0.870853712536D+00\n', ' -0.889262711727D+00 -0.905193597184D+00 -0.918785031886D+00 -0.930168524507D+00\n', ' -0.939468809474D+00 -0.946804205618D+00 -0.952286954712D+00 -0.956023541090D+00\n', ' -0.958114993490D+00 -0.958657170165D+00 -0.957741028255D+00 -0.955452878353D+00\n', ' -0.951874625121D+00 -0.947083994787D+00 -0.941154750263D+00 -0.934156894630D+00\n', ' -0.926156863626D+00 -0.917217707805D+00 -0.907399264928D+00 -0.896758323153D+00\n', ' -0.885348775560D+00 -0.873221766467D+00 -0.860425830039D+00 -0.847007021587D+00\n', ' -0.833009041991D+00 -0.818473355609D+00 -0.803439302052D+00 -0.787944202144D+00\n', ' -0.772023458408D+00 -0.755710650358D+00 -0.739037624891D+00 -0.722034582045D+00\n', ' -0.704730156373D+00 -0.687151494166D+00 -0.669324326756D+00 -0.651273040100D+00\n', ' -0.633020740852D+00 -0.614589319101D+00 -0.595999507967D+00 -0.577270940196D+00\n', ' -0.558422201943D+00 -0.539470883862D+00 -0.520433629664D+00 -0.501326182266D+00\n', ' -0.482163427655D+00 -0.462959436593D+00 -0.443727504267D+00 -0.424480187992D+00\n', ' -0.405229343069D+00 -0.385986156892D+00 -0.366761181390D+00 -0.347564363890D+00\n', ' -0.347564363890D+00 -0.330057138148D+00 -0.313682152626D+00 -0.298093260983D+00\n', ' -0.283173370401D+00 -0.268856913569D+00 -0.255100360984D+00 -0.241871811683D+00\n', ' -0.229146262694D+00 -0.216903128162D+00 -0.205124810335D+00 -0.193795819972D+00\n', ' -0.182902207530D+00 -0.172431181099D+00 -0.162370841951D+00 -0.152709997006D+00\n', ' -0.143438023184D+00 -0.134544767629D+00 -0.126020473299D+00 -0.117855722784D+00\n', ' -0.110041395437D+00 -0.102568634352D+00 -0.954288206976D-01 -0.886135535959D-01\n', ' -0.821146342275D-01 -0.759240531543D-01 -0.700339801250D-01 -0.644367557932D-01\n', ' -0.591248849168D-01 -0.540910307059D-01 -0.493280100624D-01 -0.448287895118D-01\n', ' -0.405864816722D-01 -0.365943421386D-01 -0.328457666874D-01 -0.293342887278D-01\n', ' -0.260535769401D-01 -0.229974330573D-01 -0.201597897530D-01 -0.175347086082D-01\n', ' -0.151163781367D-01 -0.128991118507D-01 -0.108773463570D-01 -0.904563947108D-02\n', ' -0.739866834524D-02 -0.593122760428D-02 -0.463822748578D-02 -0.351469198292D-02\n', ' -0.255575698884D-02 -0.175666844166D-02 -0.111278047091D-02 -0.619553545292D-03\n', ' -0.272552623174D-03 -0.674453065838D-04 -0.112512836764D-13\n', '   43\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.268444513742D-01\n', ' -0.500548066307D-01 -0.699457900360D-01 -0.868078731501D-01 -0.100909115568D+00\n', ' -0.112496862702D+00 -0.121799312141D+00 -0.129026959167D+00 -0.134373931089D+00\n', ' -0.138019219277D+00 -0.140127817026D+00 -0.140851770688D+00 -0.140331150927D+00\n', ' -0.138694950372D+00 -0.136061913408D+00 -0.132541303434D+00 -0.128233612407D+00\n', ' -0.123231217174D+00 -0.117618986681D+00 -0.111474843842D+00 -0.104870285545D+00\n', ' -0.978708639919D-01 -0.905366323184D-01 -0.829225572075D-01 -0.750789009913D-01\n', ' -0.670515755483D-01 -0.588824701153D-01 -0.506097549736D-01 -0.422681628129D-01\n', ' -0.338892494404D-01 -0.255016353702D-01 -0.171312297148D-01 -0.880143768684D-02\n', ' -0.533352923024D-03  0.765406425161D-02  0.157438215857D-01  0.237207417339D-01\n', '  0.315713202766D-01  0.392835941091D-01  0.468470194448D-01  0.542523587328D-01\n', '  0.614915758422D-01  0.685577389142D-01  0.754449303262D-01  0.821481632554D-01\n', '  0.886633043631D-01  0.949870021620D-01  0.101116620654D+00  0.107050177862D+00\n', '  0.112786288906D+00  0.118324113288D+00  0.123663306099D+00  0.128803972858D+00\n', '  0.133746627717D+00  0.138492154809D+00  0.143041772497D+00  0.147397000323D+00\n', '  0.151559628473D+00  0.155531689558D+00  0.159315432565D+00  0.162913298813D+00\n', '  0.166327899774D+00  0.169561996620D+00  0.172618481381D+00  0.175500359595D+00\n', '  0.178210734336D+00  0.180752791535D+00  0.183129786488D+00  0.185345031472D+00\n', '  0.185345031472D+00  0.184931678626D+00  0.182571003170D+00  0.179102705992D+00\n', '  0.174861661976D+00  0.170054289762D+00  0.164825839363D+00  0.159285689158D+00\n', '  0.153519615050D+00  0.147596680139D+00  0.141573498882D+00  0.135497066883D+00\n', '  0.129406739952D+00  0.123335675859D+00  0.117311919408D+00  0.111359240949D+00\n', '  0.105497798650D+00  0.997446711754D-01  0.941142927526D-01  0.886188131823D-01\n', '  0.832683990877D-01  0.780714884291D-01  0.730350073337D-01  0.681645561664D-01\n', '  0.634645702171D-01  0.589384592422D-01  0.545887292324D-01  0.504170891306D-01\n', '  0.464245447124D-01  0.426114814506D-01  0.389777378725D-01  0.355226706676D-01\n', '  0.322452126076D-01  0.291439241729D-01  0.262170396519D-01  0.234625083646D-01\n', '  0.208780315749D-01  0.184610955785D-01  0.162090013874D-01  0.141188913829D-01\n', '  0.121877732559D-01  0.104125415219D-01  0.878999685767D-02  0.731686348191D-02\n', '  0.598980477569D-02  0.480543731577D-02  0.376034347671D-02  0.285108273952D-02\n', '  0.207420183130D-02  0.142624380619D-02  0.903756167956D-03  0.503298123378D-03\n', '  0.221447047829D-03  0.548042354075D-04  0.212654742276D-13\n', '   47\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.710237424182D-01\n', '  0.132432570268D+00  0.185059165691D+00  0.229672044198D+00  0.266980424813D+00\n', '  0.297638721984D+00  0.322250689785D+00  0.341373246380D+00  0.355520004351D+00\n', '  0.365164530355D+00  0.370743355613D+00  0.372658756962D+00  0.371281326549D+00\n', '  0.366952346784D+00  0.359985985786D+00  0.350671327331D+00  0.339274248149D+00\n', '  0.326039154403D+00  0.311190588218D+00  0.294934714247D+00  0.277460695473D+00\n', '  0.258941966722D+00  0.239537413656D+00  0.219392464448D+00  0.198640100731D+00\n', '  0.177401793916D+00  0.155788372506D+00  0.133900825574D+00  0.111831047179D+00\n', '  0.896625261379D-01  0.674709852150D-01  0.453249734781D-01  0.232864152992D-01\n', '  0.141111919535D-02 -0.202507505287D-01 -0.416542366014D-01 -0.627591835418D-01\n', ' -0.835298620138D-01 -0.103934620617D+00 -0.123945563116D+00 -0.143538249246D+00\n', ' -0.162691417404D+00 -0.181386727616D+00 -0.199608523324D+00 -0.217343610635D+00\n', ' -0.234581053762D+00 -0.251311985504D+00 -0.267529431666D+00 -0.283228148429D+00\n', ' -0.298404471743D+00 -0.313056177862D+00 -0.327182354243D+00 -0.340783280060D+00\n', ' -0.353860315633D+00 -0.366415800159D+00 -0.378452957120D+00 -0.389975806852D+00\n', ' -0.400989085737D+00 -0.411498171559D+00 -0.421509014581D+00 -0.431028073925D+00\n', ' -0.440062258894D+00 -0.448618874864D+00 -0.456705573429D+00 -0.464330306491D+00\n', ' -0.471501284016D+00 -0.478226935182D+00 -0.484515872695D+00 -0.490376860015D+00\n', ' -0.490376860015D+00 -0.489283231183D+00 -0.483037471001D+00 -0.473861219194D+00\n', ' -0.462640471428D+00 -0.449921360090D+00 -0.436088180592D+00 -0.421430320923D+00\n', ' -0.406174722792D+00 -0.390504109986D+00 -0.374568270278D+00 -0.358491542350D+00\n', ' -0.342378051888D+00 -0.326315526106D+00 -0.310378164577D+00 -0.294628857739D+00\n', ' -0.279120939092D+00 -0.263899594534D+00 -0.249003013440D+00 -0.234463341162D+00\n', ' -0.220307476057D+00 -0.206557742868D+00 -0.193232466407D+00 -0.180346463845D+00\n', ' -0.167911469858D+00 -0.155936505812D+00 -0.144428201936D+00 -0.133391079667D+00\n', ' -0.122827800038D+00 -0.112739382914D+00 -0.103125401078D+00 -0.939841524914D-01\n', ' -0.853128135320D-01 -0.771075755900D-01 -0.693637670313D-01 -0.620759622664D-01\n', ' -0.552380794118D-01 -0.488434678304D-01 -0.428849866719D-01 -0.373550753871D-01\n', ' -0.322458170709D-01 -0.275489953832D-01 -0.232561457104D-01 -0.193586011502D-01\n', ' -0.158475338383D-01 -0.127139920785D-01 -0.994893368355D-02 -0.754325589604D-02\n', ' -0.548782221457D-02 -0.377348642013D-02 -0.239111406624D-02 -0.133160166979D-02\n', ' -0.585893817112D-03 -0.144998377667D-03 -0.576892540902D-13\n', '   73\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.120919961757D+00\n', ' -0.214786820424D+00 -0.285128512040D+00 -0.335095657689D+00 -0.367499098133D+00\n', ' -0.384843759298D+00 -0.389359210512D+00 -0.383027240913D+00 -0.367606746704D+00\n', ' -0.344656192610D+00 -0.315553884595D+00 -0.281516267282D+00 -0.243614438314D+00\n', ' -0.202789052911D+00 -0.159863774732D+00 -0.115557413810D+00 -0.704948785238D-01\n', ' -0.252170561122D-01  0.198102749088D-01  0.641884071634D-01  0.107578457441D+00\n', '  0.149694834283D+00  0.190299351434D+00  0.229195925094D+00  0.266225798879D+00\n', '  0.301263245802D+00  0.334211701450D+00  0.365000286900D+00  0.393580683926D+00\n', '  0.419924328576D+00  0.444019892484D+00  0.465871024148D+00  0.485494325107D+00\n', '  0.502917538266D+00  0.518177927851D+00  0.531320832352D+00  0.542398373649D+00\n', '  0.551468307049D+00  0.558592998456D+00  0.563838516178D+00  0.567273826059D+00\n', '  0.568970079710D+00  0.568999986582D+00  0.567437261474D+00  0.564356139923D+00\n', '  0.559830954572D+00  0.553935766337D+00  0.546744044736D+00  0.538328392293D+00\n', '  0.528760308437D+00  0.518109988718D+00  0.506446155605D+00  0.493835917454D+00\n', '  0.480344652589D+00  0.466035915721D+00  0.450971364214D+00  0.435210701935D+00\n', '  0.418811638652D+00  0.401829863159D+00  0.384319028467D+00  0.366330747570D+00\n', '  0.347914598470D+00  0.329118137231D+00  0.309986918002D+00  0.290564519036D+00\n', '  0.270892573831D+00  0.251010806625D+00  0.230957071537D+00  0.210767394748D+00\n', '  0.210767394748D+00  0.194872722910D+00  0.181954147621D+00  0.170720796879D+00\n', '  0.160691324308D+00  0.151585755783D+00  0.143217785841D+00  0.135454581775D+00\n', '  0.128197437948D+00  0.121371007313D+00  0.114916705224D+00  0.108788385526D+00\n', '  0.102949360099D+00  0.973702639649D-01  0.920274795158D-01  0.869019453892D-01\n', '  0.819782387537D-01  0.772438572460D-01  0.726886500433D-01  0.683043625011D-01\n', '  0.640842686815D-01  0.600228728605D-01  0.561156658172D-01  0.523589250768D-01\n', '  0.487495507301D-01  0.452849302651D-01  0.419628272086D-01  0.387812894162D-01\n', '  0.357385736489D-01  0.328330837010D-01  0.300633198412D-01  0.274278377140D-01\n', '  0.249252151739D-01  0.225540257744D-01  0.203128178425D-01  0.182000982443D-01\n', '  0.162143200854D-01  0.143538737057D-01  0.126170804319D-01  0.110021886245D-01\n', '  0.950737163371D-02  0.813072732961D-02  0.687027892533D-02  0.572397685272D-02\n', '  0.468970148569D-02  0.376526653556D-02  0.294842297179D-02  0.223686334081D-02\n', '  0.162822637464D-02  0.112010180264D-02  0.710035283844D-03  0.395533403271D-03\n', '  0.174068670187D-03  0.430844801113D-04 -0.125071680895D-12\n', '   77\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.643071732209D-01\n', ' -0.114227072733D+00 -0.151635911453D+00 -0.178209240157D+00 -0.195441909001D+00\n', ' -0.204666077730D+00 -0.207067467039D+00 -0.203700024146D+00 -0.195499158236D+00\n', ' -0.183293685821D+00 -0.167816612099D+00 -0.149714861810D+00 -0.129558061846D+00\n', ' -0.107846467724D+00 -0.850181169764D-01 -0.614552842961D-01 -0.374903059721D-01\n', ' -0.134108345054D-01  0.105354216260D-01  0.341364234511D-01  0.572119474482D-01\n', '  0.796101115036D-01  0.101204244350D+00  0.121890065481D+00  0.141583145707D+00\n', '  0.160216621403D+00  0.177739138065D+00  0.194113001148D+00  0.209312514243D+00\n', '  0.223322486585D+00  0.236136893566D+00  0.247757675516D+00  0.258193661399D+00\n', '  0.267459605338D+00  0.275575325044D+00  0.282564932253D+00  0.288456146215D+00\n', '  0.293279682129D+00  0.297068707182D+00  0.299858357558D+00  0.301685310398D+00\n', '  0.302587405270D+00  0.302603310223D+00  0.301772227971D+00  0.300133638159D+00\n', '  0.297727072080D+00  0.294591916516D+00  0.290767243732D+00  0.286291664915D+00\n', '  0.281203204606D+00  0.275539193924D+00  0.269336180580D+00  0.262629853871D+00\n', '  0.255454983039D+00  0.247845367497D+00  0.239833797619D+00  0.231452024878D+00\n', '  0.222730740254D+00  0.213699559940D+00  0.204387017466D+00  0.194820561451D+00\n', '  0.185026558269D+00  0.175030298997D+00  0.164856010062D+00  0.154526867078D+00\n', '  0.144065011405D+00  0.133491569030D+00  0.122826671379D+00  0.112089477754D+00\n', '  0.112089477754D+00  0.103636436582D+00  0.967661312431D-01  0.907920553210D-01\n', '  0.854582211008D-01  0.806157338563D-01  0.761655133573D-01  0.720369170416D-01\n', '  0.681774516694D-01  0.645470464748D-01  0.611145452033D-01  0.578554065912D-01\n', '  0.547501193073D-01  0.517830665868D-01  0.489416882068D-01  0.462158470294D-01\n', '  0.435973409458D-01  0.410795209987D-01  0.386569888181D-01  0.363253544515D-01\n', '  0.340810409377D-01  0.319211255624D-01  0.298432102497D-01  0.278453153280D-01\n', '  0.259257922156D-01  0.240832515371D-01  0.223165039000D-01  0.206245111227D-01\n', '  0.190063461227D-01  0.174611600124D-01  0.159881552105D-01  0.145865635856D-01\n', '  0.132556288181D-01  0.119945923008D-01  0.108026820106D-01  0.967910387520D-02\n', '  0.862303523121D-02  0.763362003566D-02  0.670996554319D-02  0.585114020384D-02\n', '  0.505617257596D-02  0.432405107641D-02  0.365372441826D-02  0.304410260828D-02\n', '  0.249405839542D-02  0.200242907626D-02  0.156801858040D-02  0.118959976698D-02\n', '  0.865916875895D-03  0.595688086562D-03  0.377608141186D-03  0.210351001681D-03\n', '  0.925725079864D-04  0.229130169002D-04 -0.594900858547D-13\n', '   81\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00\n', '  0.000000000000D+00  0.000000000000D+00  0.000000000000D+00 -0.979799203734D-01\n', ' -0.174039052415D+00 -0.231036038218D+00 -0.271523786318D+00 -0.297779885546D+00\n', ' -0.311834045795D+00 -0.315492858980D+00 -0.310362143852D+00 -0.297867111826D+00\n', ' -0.279270567219D+00 -0.255689333976D+00 -0.228109081836D+00 -0.197397707714D+00\n', ' -0.164317412676D+00 -0.129535600998D+00 -0.936347153865D-01 -0.571211112219D-01\n', ' -0.204330626145D-01  0.160520159776D-01  0.520110569948D-01  0.871694676443D-01\n', '  0.121295836768D+00  0.154197165048D+00  0.185714568251D+00  0.215719408081D+00\n', '  0.244109809548D+00  0.270807527723D+00  0.295755130311D+00  0.318913465661D+00\n', '  0.340259388763D+00  0.359783720384D+00  0.377489416858D+00  0.393389930201D+00\n', '  0.407507740141D+00  0.419873041409D+00  0.430522571212D+00  0.439498563251D+00\n', '  0.446847815925D+00  0.452620863540D+00  0.456871240411D+00  0.459654828693D+00\n', '  0.461029281639D+00  0.461053514800D+00  0.459787258350D+00  0.457290664405D+00\n', '  0.453623963772D+00  0.448847167075D+00  0.443019805740D+00  0.436200708676D+00\n', '  0.428447810968D+00  0.419817991186D+00  0.410366934280D+00  0.400149017304D+00\n', '  0.389217215491D+00  0.377623026420D+00  0.365416410278D+00  0.352645744354D+00\n', '  0.339357790146D+00  0.325597671582D+00  0.311408863019D+00  0.296833185816D+00\n', '  0.281910812404D+00  0.266680276860D+00  0.251178491138D+00  0.235440766146D+00\n', '  0.219500836983D+00  0.203390891699D+00  0.187141603008D+00  0.170782162470D+00\n', '  0.170782162470D+00  0.157902910290D+00  0.147435151619D+00  0.138332909150D+00\n', '  0.130206153984D+00  0.122828026618D+00  0.116047566083D+00  0.109757139712D+00\n', '  0.103876767571D+00  0.983453969002D-01  0.931155572972D-01  0.881498571163D-01\n', '  0.834185684345D-01  0.788978971823D-01  0.745687063085D-01  0.704155506318D-01\n', '  0.664259332265D-01  0.625897235849D-01  0.588986966237D-01  0.553461637082D-01\n', '  0.519266748958D-01  0.486357770709D-01  0.454698164684D-01  0.424257768139D-01\n', '  0.395011462901D-01  0.366938080115D-01  0.340019497921D-01  0.314239898339D-01\n', '  0.289585156121D-01  0.266042337418D-01  0.243599290092D-01  0.222244310713D-01\n', '  0.201965875819D-01  0.182752427090D-01  0.164592201804D-01  0.147473101285D-01\n', '  0.131382591244D-01  0.116307628806D-01  0.102234611895D-01  0.891493471958D-02\n', '  0.770370335957D-02  0.658822583760D-02  0.556690038820D-02  0.463806627207D-02\n', '  0.380000598301D-02  0.305094799877D-02  0.238906995839D-02  0.181250216122D-02\n', '  0.131933130164D-02  0.907604367683D-03  0.575332637913D-03  0.320495729523D-03\n', '  0.141045648670D-03  0.349108110181D-04 -0.908372818246D-13\n']
         txt = open(shapefun_new).readlines()
         print(txt)
         assert txt==reftxt
 
-    def test_neworder_potential_no_replace(self):
-        path = '../tests/files/mod_pot/test1/'
+    def test_neworder_potential_no_replace(self, tmpdir):
+        path = os.path.join(_files_dir, 'mod_pot', 'test1', '')
         pot = path+'pot'
-        out_pot = path+'pot_new'
+        out_pot = str(tmpdir.join('pot_new'))
         neworder = [0,1,2]
         # test 1: neworder_potential standard
         modify_potential().neworder_potential(pot, out_pot, neworder)
@@ -64,11 +69,11 @@ class Test_modify_potential(object):
         txt = open(out_pot).readlines()
         assert txt==reftxt
 
-    def test_neworder_potential_with_replace(self):
-        path = '../tests/files/mod_pot/test1/'
+    def test_neworder_potential_with_replace(self, tmpdir):
+        path = os.path.join(_files_dir, 'mod_pot', 'test1', '')
         pot1 = path+'out_potential'
         pot2 = path+'pot'
-        out_pot = path+'pot_new'
+        out_pot = str(tmpdir.join('pot_new'))
         neworder = [0,1,2]
         # test 2: neworder_potential with replace from second potential
         replace_newpos = [[0, 0], [2, 0]]
@@ -81,43 +86,41 @@ class Test_modify_potential(object):
 
 
 
+# input files of the KKRimp parser test, built once at import
+_parser_files_test1 = {key: os.path.join(_files_dir, 'kkrimp_parser', 'test1', fname) for key, fname in [
+    ('outfile', 'out_kkrimp'),
+    ('out_log', 'out_log.000.txt'),
+    ('out_pot', 'out_potential'),
+    ('out_enersp_at', 'out_energysp_per_atom_eV'),
+    ('out_enertot_at', 'out_energytotal_per_atom_eV'),
+    ('out_timing', 'out_timing.000.txt'),
+    ('kkrflex_llyfac', 'out_timing.000.txt'),
+    ('kkrflex_angles', 'out_timing.000.txt'),
+    ('out_spinmoms', 'out_magneticmoments.txt'),
+    ('out_orbmoms', 'out_magneticmoments.txt')]}
+
+
+@pytest.fixture(scope='module')
+def ref_out_dict_test1():
+    """ Reference output of the KKRimp parser for files/kkrimp_parser/test1 (loaded once per module). """
+    with open(os.path.join(_files_dir, 'kkrimp_parser', 'test1', 'ref_out_dict.json')) as f:
+        return json.load(f)
+
+
 class Test_kkrimp_parser_functions(object):
     """ Tests for the KKRimp parser functions. """
 
-    def test_parse_outfiles_full(self):
-        path = 'files/kkrimp_parser/test1/'
-        files = {}
-        files['outfile'] = path+'out_kkrimp'
-        files['out_log'] = path+'out_log.000.txt'
-        files['out_pot'] = path+'out_potential'
-        files['out_enersp_at'] = path+'out_energysp_per_atom_eV'
-        files['out_enertot_at'] = path+'out_energytotal_per_atom_eV'
-        files['out_timing'] = path+'out_timing.000.txt'
-        files['kkrflex_llyfac'] = path+'out_timing.000.txt'
-        files['kkrflex_angles'] = path+'out_timing.000.txt'
-        files['out_spinmoms'] = path+'out_magneticmoments.txt'
-        files['out_orbmoms'] = path+'out_magneticmoments.txt'
-        s, m, o = kkrimp_parser_functions().parse_kkrimp_outputfile({}, files)
+    def test_parse_outfiles_full(self, ref_out_dict_test1):
+        s, m, o = kkrimp_parser_functions().parse_kkrimp_outputfile({}, dict(_parser_files_test1))
         print('\nsuccess?\n{}\n'.format(s))
         print('\nmessages?\n{}\n'.format(m))
         print('\nout_dict?\n{}\n'.format(o))
-        ref = {'nspin': 1, 'single_particle_energies': [-444.3596464334259, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214, -444.35964643713214], 'energy_contour_group': {'epoints_weights': [[0.0, -0.0394094337777778], [0.0, -0.0630550940444444], [0.0, -0.0394094337777778], [-0.0024769822541747, 0.0], [-0.0057404630128926, 0.0], [-0.0089479779326236, 0.0], [-0.0120610679922089, 0.0], [-0.0150463937353027, 0.0], [-0.0178722499181652, 0.0], [-0.020508665764491, 0.0], [-0.0229276891406109, 0.0], [-0.0251036755825742, 0.0], [-0.0270135580801038, 0.0], [-0.0286370908964098, 0.0], [-0.0299570639079892, 0.0], [-0.0309594849201664, 0.0], [-0.0316337279339673, 0.0], [-0.0319726457580817, 0.0], [-0.0319726457580817, 0.0], [-0.0316337279339673, 0.0], [-0.0309594849201664, 0.0], [-0.0299570639079892, 0.0], [-0.0286370908964098, 0.0], [-0.0270135580801038, 0.0], [-0.0251036755825742, 0.0], [-0.0229276891406109, 0.0], [-0.020508665764491, 0.0], [-0.0178722499181652, 0.0], [-0.0150463937353027, 0.0], [-0.0120610679922089, 0.0], [-0.0089479779326236, 0.0], [-0.0057404630128926, 0.0], [-0.0024769822541747, 0.0], [-0.0279266575629318, 0.0], [-0.04448270793805, 0.0], [-0.0243618157190317, 0.0], [0.0, 0.0202677088], [0.0, 0.0202677088], [0.0, 0.0202677088], [0.0, 0.0202677088], [0.0, 0.0202677088], [0.0, 0.0202677088], [0.0, 0.0202677088]], 'emin_unit': 'Rydberg', 'emin': -0.5, 'epoints_contour': [[-0.5, 0.0251161406545832], [-0.5, 0.1114275488745601], [-0.5, 0.197738957094537], [-0.4984831014391768, 0.2228550977491202], [-0.4920252138125773, 0.2228550977491202], [-0.4804788460927884, 0.2228550977491202], [-0.4639637959265489, 0.2228550977491202], [-0.4426548073399023, 0.2228550977491202], [-0.4167776840778908, 0.2228550977491202], [-0.3866067042643217, 0.2228550977491202], [-0.3524616771279685, 0.2228550977491202], [-0.3147045433772342, 0.2228550977491202], [-0.273735535341155, 0.2228550977491202], [-0.2299889331560792, 0.2228550977491202], [-0.1839284607372149, 0.2228550977491202], [-0.1360423699231033, 0.2228550977491202], [-0.0868382647445915, 0.2228550977491202], [-0.0368377206159634, 0.2228550977491202], [0.0134292445445464, 0.2228550977491202], [0.0634297886731745, 0.2228550977491202], [0.1126338938516863, 0.2228550977491202], [0.1605199846657979, 0.2228550977491202], [0.2065804570846622, 0.2228550977491202], [0.2503270592697379, 0.2228550977491202], [0.2912960673058172, 0.2228550977491202], [0.3290532010565514, 0.2228550977491202], [0.3631982281929046, 0.2228550977491202], [0.3933692080064737, 0.2228550977491202], [0.4192463312684852, 0.2228550977491202], [0.4405553198551319, 0.2228550977491202], [0.4570703700213714, 0.2228550977491202], [0.4686167377411602, 0.2228550977491202], [0.4750746253677597, 0.2228550977491202], [0.4943938904856447, 0.2228550977491202], [0.5554567937782341, 0.2228550977491202], [0.615192526540722, 0.2228550977491202], [0.628599339928583, 0.2069368764813259], [0.628599339928583, 0.1751004339457373], [0.628599339928583, 0.1432639914101487], [0.628599339928583, 0.1114275488745601], [0.628599339928583, 0.0795911063389715], [0.628599339928583, 0.0477546638033829], [0.628599339928583, 0.0159182212677943]], 'epoints_contour_unit': 'Rydberg', 'number_of_energy_points': 43}, 'energy': -585774.7465183247, 'warnings_group': {'number_of_warnings': 0, 'warnings_list': []}, 'energy_unit': 'eV', 'charge_core_states_per_atom': [18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0, 18.0], 'timings_group': {'Total running time': 8.0738000869751, 'energyloop': 7.4141001701355, 'time until scf starts': 0.102099999785423, 'gref->gmat': 0.06130000069970265, 'vpot->tmat': 2.6435999982059, 'Iteration number': 7.97079992294312, 'gonsite->density': 4.697899959981443}, 'core_states_group': {'energy_highest_lying_core_state_per_atom_unit': 'Rydberg', 'energy_highest_lying_core_state_per_atom': [-4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155, -4.47233316155], 'number_of_core_states_per_atom': [5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5], 'descr_highest_lying_core_state_per_atom': ['3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p', '3p']}, 'total_energy_Ry': -43053.65012505, 'fermi_energy': 0.6285993399, 'convergence_group': {'strmix': 0.05, 'rms': 2.3716e-05, 'rms_unit': 'unitless', 'qbound': 1e-07, 'calculation_converged': False, 'nsteps_exhausted': True, 'brymix': 0.05, 'number_of_iterations_max': 1, 'number_of_iterations': 1, 'rms_per_atom': [2.8353e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05, 2.2917e-05], 'fcm': 2.0, 'rms_all_iterations': [2.3716e-05], 'total_energy_Ry_all_iterations': [-43053.65012505], 'imix': 0}, 'total_energy_Ry_unit': 'Rydberg', 'use_newsosol': False, 'total_energies_atom_unit': 'eV', 'charge_core_states_per_atom_unit': 'electron charge', 'total_energies_atom': [-350719.5210815695, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217, -350719.52108157217], 'charge_valence_states_per_atom_unit': 'electron charge', 'timings_unit': 'seconds', 'total_charge_per_atom_unit': 'electron charge', 'code_info_group': {'code_version': 'v1.2-26-g84cbc08', 'calculation_serial_number': '20180502163421', 'compile_options': 'serial'}, 'single_particle_energies_unit': 'eV', 'fermi_energy_units': 'Ry', 'charge_valence_states_per_atom': [10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993, 10.999993], 'number_of_atoms_in_unit_cell': 13, 'total_charge_per_atom': [28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993, 28.999993]}
         assert s
         assert m==[]
-        assert o==ref
+        assert o==ref_out_dict_test1
 
     def test_parse_file_errors(self):
-        files = {}
-        files['outfile'] = 'no_file_there'
-        files['out_log'] = 'no_file_there'
-        files['out_pot'] = 'no_file_there'
-        files['out_enersp_at'] = 'no_file_there'
-        files['out_enertot_at'] = 'no_file_there'
-        files['out_timing'] = 'no_file_there'
-        files['kkrflex_llyfac'] = 'no_file_there'
-        files['kkrflex_angles'] = 'no_file_there'
-        files['out_spinmoms'] = 'no_file_there'
-        files['out_orbmoms'] = 'no_file_there'
+        files = {key: 'no_file_there' for key in _parser_files_test1}
         s, m, o = kkrimp_parser_functions().parse_kkrimp_outputfile({}, files)
         print('\nsuccess?\n{}\n'.format(s))
         print('\nmessages?\n{}\n'.format(m))
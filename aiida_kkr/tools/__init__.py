@@ -5,7 +5,7 @@ tools provided by aiida-kkr plugin
 # import all tools here to expose them in `aiida_kkr.tools` directly
 from .common_workfunctions import (update_params_wf, prepare_VCA_structure_wf, prepare_2Dcalc_wf, 
                                    test_and_get_codenode, get_inputs_kkr, get_inputs_kkrimporter, 
-                                   get_inputs_voronoi, get_inputs_kkrimp, get_parent_paranode, 
+                                   get_inputs_voronoi, get_inputs_kkrimp, get_parent_paranode, get_parent_calc, 
                                    generate_inputcard_from_structure, check_2Dinput_consistency, 
                                    structure_from_params, neworder_potential_wf, vca_check, 
                                    kick_out_corestates_wf, find_cluster_radius)
@@ -21,6 +21,9 @@ Dict = DataFactory('dict')
 # keys that are used by aiida-kkr some something else than KKR parameters
 _ignored_keys = ['ef_set', 'use_input_alat']
 
+# keys that need to be set for a 2D (i.e. slab) calculation
+_keys_2D_input = frozenset(['INTERFACE', '<NRBASIS>', '<RBLEFT>', '<RBRIGHT>', 'ZPERIODL', 'ZPERIODR', '<NLBASIS>'])
+
 @calcfunction
 def update_params_wf(parameternode, updatenode):
     """
@@ -85,8 +88,7 @@ def update_params(node, nodename=None, nodedesc=None, **kwargs):
         raise InputValidationError('update_params needs valid parameter node as input')
 
     # check if add_direct is in kwargs (shortcuts checks of kkrparams by not using the kkrparams class to set the dict)
-    add_direct = False
-    if 'add_direct' in kwargs.keys(): add_direct = kwargs.pop('add_direct')
+    add_direct = kwargs.pop('add_direct', False)
 
     #initialize temporary kkrparams instance containing all possible KKR parameters
     if not add_direct:
@@ -104,41 +106,28 @@ def update_params(node, nodename=None, nodedesc=None, **kwargs):
                 print('Input node contains unvalid key "{}"'.format(key))
                 raise InputValidationError('unvalid key "{}" in input parameter node'.format(key))
 
-    # copy values from input node
-    for key in inp_params:
-        value = inp_params[key]
-        if not add_direct:
-            params.set_value(key, value, silent=True)
-        else:
-            params[key] = value
-
-    # to keep track of changed values:
-    changed_params = {}
-
     # check if values are given as **kwargs (otherwise return input node)
     if len(kwargs)==0:
         print('No additional input keys given, return input node')
         return node.clone()
-    else:
-        for key in kwargs:
-            # check if value of 'key' should be set (either because it differs from old para node or because it was not set at all)
-            update_value = False
-            if key in list(inp_params.keys()):
-                if kwargs[key] != inp_params[key]:
-                    update_value = True
-            else:
-                update_value = True
-            if update_value:
-                if not add_direct:
-                    params.set_value(key, kwargs[key], silent=True)
-                else:
-                    params[key] = kwargs[key]
-                changed_params[key] = kwargs[key]
-
-    if len(list(changed_params.keys()))==0:
+
+    # keep track of changed values (either because they differ from old para node or because they were not set at all)
+    changed_params = {key: val for key, val in kwargs.items() if key not in inp_params or inp_params[key] != val}
+
+    if len(changed_params)==0:
         print('No keys have been changed, return input node')
         return node.clone()
 
+    # copy values from input node and apply the changes on top
+    if not add_direct:
+        for key, value in inp_params.items():
+            params.set_value(key, value, silent=True)
+        for key, value in changed_params.items():
+            params.set_value(key, value, silent=True)
+    else:
+        params = dict(inp_params)
+        params.update(changed_params)
+
     # set linkname with input or default value
     if nodename is None or type(nodename) is not str:
         nodename = 'updated KKR parameters'
@@ -395,16 +384,37 @@ def get_parent_paranode(remote_data):
     """
     Return the input parameter of the parent calulation giving the remote_data node
     """
-    inp_calc = remote_data.get_incoming(link_label_filter='remote_folder').first().node
-    inp_para = inp_calc.get_incoming(link_label_filter='parameters').first().node
+    from aiida.orm import CalcJobNode, QueryBuilder
+    RemoteData = DataFactory('remote')
+
+    # follow remote_folder -> calc -> parameters links in a single query
+    qb = QueryBuilder()
+    qb.append(RemoteData, filters={'id': remote_data.pk}, tag='remote')
+    qb.append(CalcJobNode, with_outgoing='remote', edge_filters={'label': 'remote_folder'}, tag='calc')
+    qb.append(Dict, with_outgoing='calc', edge_filters={'label': 'parameters'})
+    qb.limit(1)
+    res = qb.first()
+    if res is None:
+        # same exception as the previous link traversal raised (callers rely on it)
+        raise AttributeError('no parameters node found for parent calculation of {}'.format(remote_data))
+    inp_para = res[0]
     return inp_para
 
 
+def _get_param_dict(parameters):
+    """
+    return dictionary of parameters, which can be a Dict node or an already extracted dictionary
+    """
+    if isinstance(parameters, dict):
+        return parameters
+    return parameters.get_dict()
+
+
 def generate_inputcard_from_structure(parameters, structure, input_filename, parent_calc=None, shapes=None, isvoronoi=False, use_input_alat=False, vca_structure=False):
     """
     Takes information from parameter and structure data and writes input file 'input_filename'
 
-    :param parameters: input parameters node containing KKR-related input parameter
+    :param parameters: input parameters node (or its dictionary) containing KKR-related input parameter
     :param structure: input structure node containing lattice information
     :param input_filename: input filename, typically called 'inputcard'
 
@@ -442,9 +452,12 @@ def generate_inputcard_from_structure(parameters, structure, input_filename, par
     _atomic_numbers = {data['symbol']: num for num,
                     data in PeriodicTableElements.items()}
 
+    # get parameter dictionary (copy since keys are removed below)
+    input_dict = dict(_get_param_dict(parameters))
+
     # KKR wants units in bohr
     bravais = array(structure.cell)*a_to_bohr
-    alat_input = parameters.get_dict().get('ALATBASIS')
+    alat_input = input_dict.get('ALATBASIS')
     if use_input_alat and alat_input is not None:
         alat = alat_input
         wmess = 'found alat in input parameters, this will trigger scaling of RMAX, GMAX and RCLUSTZ!'
@@ -518,9 +531,6 @@ def generate_inputcard_from_structure(parameters, structure, input_filename, par
     ######################################
     # Prepare keywords for kkr from input structure
 
-    # get parameter dictionary
-    input_dict = parameters.get_dict()
-
     # remove special keys that are used for special cases but are not part of the KKR parameter set
     for key in _ignored_keys:
         if input_dict.get(key) is not None:
@@ -625,7 +635,7 @@ def check_2Dinput_consistency(structure, parameters):
     Check if structure and parameter data are complete and matching.
 
     :param input: structure, needs to be a valid aiida StructureData node
-    :param input: parameters, needs to be valid aiida Dict node
+    :param input: parameters, needs to be valid aiida Dict node (or its dictionary)
 
     returns (False, errormessage) if an inconsistency has been found, otherwise return (True, '2D consistency check complete')
     """
@@ -638,12 +648,9 @@ def check_2Dinput_consistency(structure, parameters):
         is2D = True
 
     # check for necessary info in 2D case
-    inp_dict = parameters.get_dict()
+    inp_dict = _get_param_dict(parameters)
     set_keys = [i for i in list(inp_dict.keys()) if inp_dict[i] is not None]
-    has2Dinfo = True
-    for icheck in ['INTERFACE', '<NRBASIS>', '<RBLEFT>', '<RBRIGHT>', 'ZPERIODL', 'ZPERIODR', '<NLBASIS>']:
-        if icheck not in set_keys:
-            has2Dinfo = False
+    has2Dinfo = _keys_2D_input.issubset(set_keys)
     if has2Dinfo and not inp_dict['INTERFACE'] and is2D:
         return (False, "'INTERFACE' parameter set to False but structure is 2D")
 
@@ -760,6 +767,33 @@ def structure_from_params(parameters):
     # finally return structure
     return is_complete, struc
 
+def _get_parent_calcs(remote_folder, limit=2):
+    """
+    Return the (at most `limit`) calculations that created the remote folder.
+    The lookup is done with a single query and stops after `limit` matches,
+    by default two since only uniqueness of the parent is checked afterwards.
+    """
+    from aiida.orm import CalcJobNode, QueryBuilder
+    RemoteData = DataFactory('remote')
+
+    qb = QueryBuilder()
+    qb.append(RemoteData, filters={'id': remote_folder.pk}, tag='remote')
+    qb.append(CalcJobNode, with_outgoing='remote')
+    qb.limit(limit)
+
+    return [calc for calc, in qb.all()]
+
+
+def get_parent_calc(remote_data):
+    """
+    Return the parent calculation of the remote_data node (None if there is none)
+    """
+    parent_calcs = _get_parent_calcs(remote_data, limit=1)
+    if len(parent_calcs) == 0:
+        return None
+    return parent_calcs[0]
+
+
 @calcfunction
 def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, parent_calc_folder2=None):
     """
@@ -794,7 +828,6 @@ def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, pare
     from aiida_kkr.tools.tools_kkrimp import modify_potential
     from aiida.common.folders import SandboxFolder
     from aiida.common.exceptions import UniquenessError
-    from aiida.orm import CalcJobNode
     from aiida.plugins import DataFactory
 
     if 'parent_calc_folder2' in list(kwargs.keys()):
@@ -832,7 +865,7 @@ def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, pare
     # and construct output potential
     with SandboxFolder() as tempfolder:
         # Get abolute paths of input files from parent calc and filename
-        parent_calcs = parent_calc_folder.get_incoming(node_class=CalcJobNode).all()
+        parent_calcs = _get_parent_calcs(parent_calc_folder)
         n_parents = len(parent_calcs)
         if n_parents != 1:
             raise UniquenessError(
@@ -840,7 +873,7 @@ def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, pare
                     "calculation{}, while it should have a single parent"
                     "".format(n_parents, "" if n_parents == 0 else "s"))
         else:
-            parent_calc = parent_calcs[0].node
+            parent_calc = parent_calcs[0]
         pot1_fhandle = parent_calc.outputs.retrieved.open(pot1)
 
         # extract nspin from parent calc's input parameter node
@@ -853,7 +886,7 @@ def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, pare
 
         # Copy optional files?
         if pot2 is not None and parent_calc_folder2 is not None:
-            parent_calcs = parent_calc_folder2.get_incoming(node_class=CalcJobNode).all()
+            parent_calcs = _get_parent_calcs(parent_calc_folder2)
             n_parents = len(parent_calcs)
             if n_parents != 1:
                 raise UniquenessError(
@@ -861,7 +894,7 @@ def neworder_potential_wf(settings_node, parent_calc_folder, **kwargs) : #, pare
                         "calculation{}, while it should have a single parent"
                         "".format(n_parents, "" if n_parents == 0 else "s"))
             else:
-                parent_calc = parent_calcs[0].node
+                parent_calc = parent_calcs[0]
             pot2_fhandle = parent_calc.outputs.retrieved.open(pot2)
         else:
             pot2_fhandle = None
@@ -916,7 +949,7 @@ def vca_check(structure, parameters):
         nsites += len(sitekind.symbols)
     # VCA mode if CPAINFO = [-1,-1] first
     try:
-        if parameters.get_dict().get('CPAINFO')[0]<0:
+        if _get_param_dict(parameters).get('CPAINFO')[0]<0:
             params_vca_mode= True
         else:
             params_vca_mode = False
@@ -941,7 +974,7 @@ def kick_out_corestates(potfile, potfile_out, emin):
     :returns: number of lines that have been deleted
     """
     from masci_tools.io.common_functions import get_corestates_from_potential
-    from numpy import where, array
+    from numpy import where
 
     # read core states
     nstates, energies, lmoments = get_corestates_from_potential(potfile)
@@ -952,7 +985,7 @@ def kick_out_corestates(potfile, potfile_out, emin):
 
         #get start of each potential part
         istarts = [iline for iline in range(len(txt)) if 'POTENTIAL' in txt[iline]]
-        all_lines = list(range(len(txt))) # index array
+        lines_out = set() # indices of the lines that are removed
 
         # change list of core states
         for ipot in range(len(nstates)):
@@ -964,9 +997,10 @@ def kick_out_corestates(potfile, potfile_out, emin):
                     #print(txt[istart+6])
                     txt[istart+6] = '%i 1\n'%(nstates[ipot]-len(m[0]))
                     # now remove energy line accordingly
-                    for ie_out in m[0][::-1]:
-                        m_out = where(array(all_lines)==istart+6+ie_out+1)[0][0]
-                        e_out = all_lines.pop(m_out)
+                    lines_out.update(istart+6+ie_out+1 for ie_out in m[0])
+
+        # index array of the lines that are kept (filtered in a single pass)
+        all_lines = [iline for iline in range(len(txt)) if iline not in lines_out]
 
         # find number of deleted lines
         num_deleted = len(txt)-len(all_lines)
@@ -633,7 +633,7 @@ class plot_kkr(object):
                 has_qdos = 'qdos.01.1.dat' in retlist
                 if has_qdos:
                     with node.outputs.retrieved.open('qdos.01.1.dat', mode='r') as f:
-                        ne = len(set(loadtxt(f)[:,0]))
+                        ne = len(set(loadtxt(f, usecols=(0,))))
                         if ne>1 or 'as_e_dimension' in kwargs.keys():
                             ef = check_output('grep "Fermi energy" {}'.format(f.name.replace('qdos.01.1.dat', 'output.0.txt')), shell=True) 
                             ef = float(ef.split('=')[2].split()[0])
@@ -154,20 +154,21 @@ class modify_potential(object):
         # ensure that numbers are integers:
         order = [int(i) for i in neworder]
 
-        datanew=[]
-        for i in range(len(order)):
-            # check if new position is replaced with position from old pot
-            if replace_from_pot2 is not None and i in replace_from_pot2[:,0]:
-                    replace_index = replace_from_pot2[replace_from_pot2[:,0]==i][0][1]
-                    for ii in range(index12[replace_index], index22[replace_index]+1 ):
-                        datanew.append(data2[ii])
-            else: # otherwise take new potntial according to input list
-                    for ii in range(index1[order[i]], index2[order[i]]+1 ):
-                        datanew.append(data[ii])
-
-        # write out new potential
+        # map of new positions to positions in pot2 (first entry wins, as before)
+        replace_map = {}
+        if replace_from_pot2 is not None:
+            for inew, ipot2 in replace_from_pot2:
+                replace_map.setdefault(int(inew), int(ipot2))
+
+        # write out new potential block by block without collecting all lines first
         with open_general(potfile_out,'w') as f:
-            f.writelines(datanew)
+            for i in range(len(order)):
+                # check if new position is replaced with position from old pot
+                if i in replace_map:
+                    replace_index = replace_map[i]
+                    f.writelines(data2[index12[replace_index]:index22[replace_index]+1])
+                else: # otherwise take new potntial according to input list
+                    f.writelines(data[index1[order[i]]:index2[order[i]]+1])
 
 
 
@@ -735,29 +736,18 @@ def get_structure_data(structure):
     _atomic_numbers = {data['symbol']:num for num,
                 data in PeriodicTableElements.items()}
 
-    #initialize the array that will be returned later (it will be a (# of atoms in the cell) x 6-matrix)
-    a = np.zeros((len(structure.sites),6))
-    k = 0 #running index for filling up the array with data correctly
-    charges = [] #will be needed to return the charge number for the different atoms later
-
-    #loop to fill up the a-array with positions, index, charge and a 0. for every atom in the cell
     sites = structure.sites
-    n = len(structure.sites) + 1 #needed to do the indexing of atoms
-    m = len(structure.sites) #needed to do the indexing of atoms
-    for site in sites:
-        for j in range(3):
-            a[k][j] = site.position[j]
-        sitekind = structure.get_kind(site.kind_name)
-        naez = n - m
-        m = m - 1
-        #convert the element symbol from StructureData to the charge number
-        for ikind in range(len(sitekind.symbols)):
-            site_symbol = sitekind.symbols[ikind]
-            charges.append(_atomic_numbers[site_symbol])
-        i = len(charges) - 1
-        a[k][3] = int(naez)
-        a[k][4] = float(charges[i])
-        k = k + 1
+
+    #charge number of every kind (for alloys the last symbol of the kind is used)
+    kind_charges = {}
+    for kind in structure.kinds:
+        kind_charges[kind.name] = float(_atomic_numbers[kind.symbols[-1]])
+
+    #fill the (# of atoms in the cell) x 6-matrix column by column: positions, index (starting at 1), charge and a 0.
+    a = np.zeros((len(sites),6))
+    a[:,:3] = np.array([site.position for site in sites], dtype=float).reshape(-1, 3)
+    a[:,3] = np.arange(1, len(sites)+1)
+    a[:,4] = [kind_charges[site.kind_name] for site in sites]
 
     return a
 
@@ -791,10 +781,8 @@ def select_reference(structure_array, i):
     x_ref = np.array([structure_array[i][0], structure_array[i][1], structure_array[i][2], 0, 0, 0])
 
     #calculate the positions and distances for all atoms in the cell with respect to the chosen atom i
-    for k in range(len(structure_array)):
-        x[k][5] = get_distance(structure_array, i, k)
-        for j in range(5):
-            x[k][j] = structure_array[k][j] - x_ref[j]
+    x[:,5] = _get_distances(structure_array, i)
+    x[:,:5] = structure_array[:,:5] - x_ref[:5]
 
     return x
 
@@ -821,6 +809,16 @@ def get_distance(structure_array, i, j):
     #return absolute value of the distance of atom i and j
     return math.sqrt(del_x*del_x + del_y*del_y + del_z*del_z)
 
+def _get_distances(structure_array, i):
+    """
+    Vectorized version of get_distance: returns the distances of all atoms in structure_array to atom i
+    (same operations as in get_distance, thus the same values are obtained)
+    """
+    import numpy as np
+
+    delta = structure_array[i,:3] - structure_array[:,:3]
+    return np.sqrt(delta[:,0]*delta[:,0] + delta[:,1]*delta[:,1] + delta[:,2]*delta[:,2])
+
 def rotate_onto_z(structure, structure_array, vector):
     """
     Rotates all positions of a structure array of orientation 'orient' onto the z-axis. Needed to implement the
@@ -892,7 +890,6 @@ def find_neighbors(structure, structure_array, i, radius, clust_shape='spherical
 
     #import packages
     import numpy as np
-    import math
 
     # make sure we take the correct cell length for 2D structures
     if not structure.pbc[2]:
@@ -932,48 +929,39 @@ def find_neighbors(structure, structure_array, i, radius, clust_shape='spherical
     box = max(box_1, box_2, box_3)
     cell = np.array(structure.cell)
     cell[2] = c3
-    for j in range(len(x)):
-        for n in range(-box, box + 1):
-            for m in range(-box, box + 1):
-                for l in range(-box, box + 1):
-                    x_temp = np.append(x_temp, [[x[j][0] + (n*cell[0][0] + m*cell[1][0] + l*cell[2][0]),
-                                                 x[j][1] + (n*cell[0][1] + m*cell[1][1] + l*cell[2][1]),
-                                                 x[j][2] + (n*cell[0][2] + m*cell[1][2] + l*cell[2][2]),
-                                                 x[j][3], x[j][4], 0.]], axis = 0)
+    # all translation vectors n*a1 + m*a2 + l*a3 (same order as looping over n, m, l with l running fastest)
+    nml = np.arange(-box, box + 1)
+    n, m, l = [g.ravel() for g in np.meshgrid(nml, nml, nml, indexing='ij')]
+    shifts = n[:,np.newaxis]*cell[0] + m[:,np.newaxis]*cell[1] + l[:,np.newaxis]*cell[2]
+    # periodic images of all atoms j (atoms running slowest), distance column is set to zero
+    images = np.zeros((len(x), len(shifts), 6))
+    images[:,:,:3] = x[:,np.newaxis,:3] + shifts[np.newaxis,:,:]
+    images[:,:,3:5] = x[:,np.newaxis,3:5]
+    x_temp = np.concatenate((x_temp, images.reshape(-1, 6)), axis=0)
 
     #x_temp now contains all the atoms and their positions regardless if they are bigger or smaller than the cutoff
     x_new = x_temp
 
-    #calculate the distances between all the atoms and the center atom i
-    for j in range(len(x_temp)):
-        x_new[j][5] = get_distance(x_temp, 0, j)
-
-    #initialize result array
-    x_res = np.array([x[i]])
+    #calculate the distances between all the atoms and the center atom i (first entry of x_temp)
+    x_new[:,5] = _get_distances(x_temp, 0)
 
     #only take atoms into account whose distance to atom i is smaller than the cutoff radius
     #dist_cut = dist_cut
     if clust_shape == 'spherical':
-        for j in range(len(x_temp)):
-            if x_new[j][5] <= dist_cut and x_new[j][5] > 0.:
-                x_res = np.append(x_res, [[x_temp[j][0],
-                                             x_temp[j][1],
-                                             x_temp[j][2],
-                                             x_temp[j][3], x_temp[j][4], x_new[j][5]]], axis=0)
+        in_cluster = (x_new[:,5] <= dist_cut) & (x_new[:,5] > 0.)
     elif clust_shape == 'cylindrical':
-        for j in range(len(x_temp)):
-            #rotate system into help system that is aligned with the z-axis
-            x_help = rotate_onto_z(structure, x_temp, vector)
-
-            #calculate in plane distance and vertical distance
-            vert_dist = np.absolute(x_help[j][2])
-            inplane_dist = math.sqrt(x_help[j][0]**2 + x_help[j][1]**2)
-            #print(vert_dist, inplane_dist)
-            if vert_dist <= h/2. and inplane_dist <= radius and x_new[j][5] > 0.:
-                x_res = np.append(x_res, [[x_temp[j][0],
-                                             x_temp[j][1],
-                                             x_temp[j][2],
-                                             x_temp[j][3], x_temp[j][4], x_new[j][5]]], axis=0)
+        #rotate system into help system that is aligned with the z-axis
+        x_help = rotate_onto_z(structure, x_temp, vector)
+
+        #calculate in plane distance and vertical distance
+        vert_dist = np.absolute(x_help[:,2])
+        inplane_dist = np.sqrt(x_help[:,0]**2 + x_help[:,1]**2)
+        in_cluster = (vert_dist <= h/2.) & (inplane_dist <= radius) & (x_new[:,5] > 0.)
+    else:
+        in_cluster = np.zeros(len(x_new), dtype=bool)
+
+    #result array starts with atom i followed by all atoms inside the cluster
+    x_res = np.concatenate((np.array([x[i]]), x_new[in_cluster]), axis=0)
 
     #return an unordered array of all the atoms which are within the cutoff distance with respect to atom i
     return x_res
@@ -990,27 +978,17 @@ def write_scoef(x_res, path):
              indices, charges and distances in the subsequent lines.
     """
 
+    import numpy as np
+
     #sort the data from x_res with respect to distance to the centered atom
     m = x_res[:,-1].argsort()
     x_res = x_res[m]
 
-    #write data of x_res into the 'scoef'-file
+    #write data of x_res into the 'scoef'-file (all lines are formatted in one go by numpy)
     with open_general(path, 'w') as file:
         file.write(str("{0:4d}".format(len(x_res))))
         file.write("\n")
-        for i in range(len(x_res)):
-            file.write(str("{0:26.19e}".format(x_res[i][0])))
-            file.write(" ")
-            file.write(str("{0:26.19e}".format(x_res[i][1])))
-            file.write(" ")
-            file.write(str("{0:26.19e}".format(x_res[i][2])))
-            file.write(" ")
-            file.write(str("{0:4d}".format(int(x_res[i][3]))))
-            file.write(" ")
-            file.write(str("{0:4.1f}".format(x_res[i][4])))
-            file.write(" ")
-            file.write(str("{0:26.19e}".format(x_res[i][5])))
-            file.write("\n")
+        np.savetxt(file, x_res, fmt='%26.19e %26.19e %26.19e %4d %4.1f %26.19e')
 
 def make_scoef(structure, radius, path, h=-1., vector=[0., 0., 1.], i=0, alat_input=None):
     """
@@ -13,6 +13,7 @@ from aiida.plugins import DataFactory
 from aiida.engine import WorkChain, if_, ToContext
 from aiida.engine import submit
 from masci_tools.io.kkr_params import kkrparams
+from masci_tools.io.common_functions import get_Ry2eV
 from aiida_kkr.tools.common_workfunctions import test_and_get_codenode, get_parent_paranode, update_params_wf, get_inputs_kkr
 from aiida_kkr.calculations.kkr import KkrCalculation
 from aiida_kkr.calculations.voro import VoronoiCalculation
@@ -34,6 +35,12 @@ StructureData = DataFactory('structure')
 Dict = DataFactory('dict')
 XyData = DataFactory('array.xy')
 
+# translation of the DOS contour names used in wf_parameters to KKR keywords
+_DOS_KEY_MAP = {'kmesh': 'BZDIVIDE', 'nepts': 'NPT2', 'emin': 'EMIN', 'emax': 'EMAX', 'tempr': 'TEMPR'}
+
+# conversion factor Ry -> eV (constant, evaluated once at import)
+_RY2EV = get_Ry2eV()
+
 class kkr_dos_wc(WorkChain):
     """
     Workchain a DOS calculation with KKR starting from the remoteData node
@@ -261,21 +268,11 @@ class kkr_dos_wc(WorkChain):
         econt_new['NPT3'] = 0
         try:
             for key, val in econt_new.items():
-                if key=='kmesh':
-                    key = 'BZDIVIDE'
-                elif key=='nepts':
-                    key = 'NPT2'
+                if key=='nepts':
                     # add IEMXD which has to be big enough
-                    print('setting IEMXD', val)
                     para_check.set_value('IEMXD', val, silent=True)
-                elif key=='emin':
-                    key = 'EMIN'
-                elif key=='emax':
-                    key = 'EMAX'
-                elif key=='tempr':
-                    key = 'TEMPR'
-                # set params
-                para_check.set_value(key, val, silent=True)
+                # set params (translate wf_parameters names to KKR keywords)
+                para_check.set_value(_DOS_KEY_MAP.get(key, key), val, silent=True)
         except:
             return self.exit_codes.ERROR_DOS_PARAMS_INVALID
 
@@ -293,17 +290,17 @@ class kkr_dos_wc(WorkChain):
         """
 
         label = 'KKR DOS calc.'
-        dosdict = self.ctx.dos_params_dict
-        description = 'dos calc: emin= {}, emax= {}, nepts= {}, tempr={}, kmesh={}'.format(dosdict['emin'], dosdict['emax'], dosdict['nepts'], dosdict['tempr'], dosdict['kmesh'])
+        ctx = self.ctx
+        description = 'dos calc: emin= {emin}, emax= {emax}, nepts= {nepts}, tempr={tempr}, kmesh={kmesh}'.format(**ctx.dos_params_dict)
         code = self.inputs.kkr
         remote = self.inputs.remote_data
-        params = self.ctx.dos_kkrparams
-        options = {"max_wallclock_seconds": self.ctx.max_wallclock_seconds,
-                   "resources": self.ctx.resources,
-                   "queue_name" : self.ctx.queue}#,
-        if self.ctx.custom_scheduler_commands:
-            options["custom_scheduler_commands"] = self.ctx.custom_scheduler_commands
-        inputs = get_inputs_kkr(code, remote, options, label, description, parameters=params, serial=(not self.ctx.use_mpi))
+        params = ctx.dos_kkrparams
+        options = {"max_wallclock_seconds": ctx.max_wallclock_seconds,
+                   "resources": ctx.resources,
+                   "queue_name" : ctx.queue}#,
+        if ctx.custom_scheduler_commands:
+            options["custom_scheduler_commands"] = ctx.custom_scheduler_commands
+        inputs = get_inputs_kkr(code, remote, options, label, description, parameters=params, serial=(not ctx.use_mpi))
 
         # run the DOS calculation
         self.report('INFO: doing calculation')
@@ -322,11 +319,13 @@ class kkr_dos_wc(WorkChain):
         therefore it only uses results from context.
         """
 
+        dosrun = self.ctx.dosrun
+
         # capture error of unsuccessful DOS run
-        if not self.ctx.dosrun.is_finished_ok:
+        if not dosrun.is_finished_ok:
             self.ctx.successful = False
             error = ('ERROR: DOS calculation failed somehow it is '
-                    'in state {}'.format(self.ctx.dosrun.process_state))
+                    'in state {}'.format(dosrun.process_state))
             self.report(error)
             self.ctx.errors.append(error)
             return self.exit_codes.ERROR_DOS_CALC_FAILED
@@ -342,7 +341,7 @@ class kkr_dos_wc(WorkChain):
         outputnode_dict['custom_scheduler_commands'] = self.ctx.custom_scheduler_commands
         outputnode_dict['dos_params'] = self.ctx.dos_params_dict
         try:
-            outputnode_dict['nspin'] = self.ctx.dosrun.res.nspin
+            outputnode_dict['nspin'] = dosrun.res.nspin
         except:
             error = "ERROR: nspin not extracted"
             self.report(error)
@@ -357,7 +356,8 @@ class kkr_dos_wc(WorkChain):
 
         self.report("INFO: create dos results nodes: outputnode={}".format(outputnode))
         try:
-            self.report("INFO: create dos results nodes. dos calc retrieved node={}".format(self.ctx.dosrun.outputs.retrieved))
+            dos_retrieved = dosrun.outputs.retrieved
+            self.report("INFO: create dos results nodes. dos calc retrieved node={}".format(dos_retrieved))
             has_dosrun = True
         except AttributeError as e:
             self.report("ERROR: no dos calc retrieved node found")
@@ -368,9 +368,10 @@ class kkr_dos_wc(WorkChain):
         outdict['results_wf'] = outputnode
         # interpol dos file and store to XyData nodes
         if has_dosrun:
-            dos_retrieved = self.ctx.dosrun.outputs.retrieved
             if 'complex.dos' in dos_retrieved.list_object_names():
-                dosXyDatas = parse_dosfiles(dos_retrieved.open('complex.dos'))
+                # hand the open file to the parser directly, it is closed once parsing is done
+                with dos_retrieved.open('complex.dos') as dosfile:
+                    dosXyDatas = parse_dosfiles(dosfile)
                 dos_extracted = True
             else:
                 dos_extracted = False
@@ -390,41 +391,30 @@ def parse_dosfiles(dosfolder):
     parse dos files to XyData nodes
     """
     from masci_tools.io.common_functions import interpolate_dos
-    from masci_tools.io.common_functions import get_Ry2eV
 
-    eVscale = get_Ry2eV()
+    eVscale = _RY2EV
 
     ef, dos, dos_int = interpolate_dos(dosfolder, return_original=True)
 
-    # convert to eV units
-    dos[:,:,0] = (dos[:,:,0]-ef)*eVscale
-    dos[:,:,1:] = dos[:,:,1:]/eVscale
-    dos_int[:,:,0] = (dos_int[:,:,0]-ef)*eVscale
-    dos_int[:,:,1:] = dos_int[:,:,1:]/eVscale
+    # convert to eV units (in place to avoid temporary arrays)
+    for dos_array in (dos, dos_int):
+        dos_array[:,:,0] -= ef
+        dos_array[:,:,0] *= eVscale
+        dos_array[:,:,1:] /= eVscale
 
     # create output nodes
     dosnode = XyData()
     dosnode.set_x(dos[:,:,0], 'E-EF', 'eV')
     name = ['tot', 's', 'p', 'd', 'f', 'g']
     name = name[:len(dos[0,0,1:])-1]+['ns']
-    ylists = [[],[],[]]
-    for l in range(len(name)):
-        ylists[0].append(dos[:,:,1+l])
-        ylists[1].append('dos '+name[l])
-        ylists[2].append('states/eV')
-    dosnode.set_y(ylists[0], ylists[1], ylists[2])
+    dosnode.set_y([dos[:,:,1+l] for l in range(len(name))], ['dos '+n for n in name], ['states/eV']*len(name))
     dosnode.label = 'dos_data'
     dosnode.description = 'Array data containing uniterpolated DOS (i.e. dos at finite imaginary part of energy). 3D array with (atoms, energy point, l-channel) dimensions.'
 
     # now create XyData node for interpolated data
     dosnode2 = XyData()
     dosnode2.set_x(dos_int[:,:,0], 'E-EF', 'eV')
-    ylists = [[],[],[]]
-    for l in range(len(name)):
-        ylists[0].append(dos_int[:,:,1+l])
-        ylists[1].append('interpolated dos '+name[l])
-        ylists[2].append('states/eV')
-    dosnode2.set_y(ylists[0], ylists[1], ylists[2])
+    dosnode2.set_y([dos_int[:,:,1+l] for l in range(len(name))], ['interpolated dos '+n for n in name], ['states/eV']*len(name))
     dosnode2.label = 'dos_interpol_data'
     dosnode2.description = 'Array data containing interpolated DOS (i.e. dos at real axis). 3D array with (atoms, energy point, l-channel) dimensions.'
 
@@ -9,9 +9,10 @@ from aiida.orm import Code, load_node
 from aiida.plugins import DataFactory
 from aiida.engine import WorkChain, ToContext, if_
 from aiida.engine import calcfunction
+from aiida.manage.caching import enable_caching
 from aiida_kkr.calculations.voro import VoronoiCalculation
 from masci_tools.io.kkr_params import kkrparams
-from aiida_kkr.tools.common_workfunctions import test_and_get_codenode, neworder_potential_wf, update_params_wf
+from aiida_kkr.tools.common_workfunctions import test_and_get_codenode, neworder_potential_wf, update_params_wf, get_parent_paranode, get_parent_calc
 from aiida_kkr.workflows.gf_writeout import kkr_flex_wc
 from aiida_kkr.workflows.voro_start import kkr_startpot_wc
 from aiida_kkr.workflows.kkr_imp_sub import kkr_imp_sub_wc, clean_sfd
@@ -129,9 +130,9 @@ class kkr_imp_wc(WorkChain):
         spec.outline(
             cls.start,                                                          # initialize workflow
             if_(cls.validate_input)(                                            # validate the input (if true, run_gf_writeout, else skip)
-                cls.run_gf_writeout),                                           # write out the host GF
+                cls.run_gf_writeout),                                           # write out the host GF (auxiliary voronoi calculation is submitted concurrently)
             if_(cls.has_starting_potential_input)(                              # check if strarting potential exists in input already (otherwise create it)
-                cls.run_voroaux,                                                  # calculate the auxiliary impurity potentials
+                cls.run_voroaux,                                                  # calculate the auxiliary impurity potentials (if not done already)
                 cls.construct_startpot),                                          # construct the host-impurity startpotential
             cls.run_kkrimp_scf,                                                 # run the kkrimp_sub workflow to converge the host-imp startpot
             cls.return_results)                                                 # check if the calculation was successful and return the result nodes
@@ -316,8 +317,7 @@ class kkr_imp_wc(WorkChain):
                 self.report(self.exit_codes.ERROR_MISSING_KKRCODE)
                 return self.exit_codes.ERROR_MISSING_KKRCODE
         elif 'remote_data_gf' in inputs:
-            remote_data_gf_node = load_node(inputs.remote_data_gf.pk)
-            pk_kkrflex_writeoutcalc = remote_data_gf_node.get_incoming(link_label_filter=u'remote_folder').first().node.pk
+            pk_kkrflex_writeoutcalc = self.get_gf_host_calc_from_input().pk
             self.report('INFO: found remote_data node (pid: {}) from previous KKRFLEX calculation (pid: {}) in input. '
                         'Skip GF writeout step and start workflow by auxiliary voronoi calculations.'
                         .format(inputs.remote_data_gf.pk, pk_kkrflex_writeoutcalc))
@@ -367,6 +367,12 @@ class kkr_imp_wc(WorkChain):
 
         self.report('INFO: running GF writeout (pid: {})'.format(future.pk))
 
+        # the auxiliary voronoi calculation does not depend on the GF writeout,
+        # thus it is submitted right away to run concurrently
+        if self.has_starting_potential_input():
+            future_voro = self.submit_voroaux()
+            return ToContext(gf_writeout=future, last_calc_gf=future, last_voro_calc=future_voro)
+
         return ToContext(gf_writeout=future, last_calc_gf=future)
 
 
@@ -387,9 +393,20 @@ class kkr_imp_wc(WorkChain):
 
 
     def run_voroaux(self):
+        """
+        Run the auxiliary voronoi calculation if it was not already submitted
+        together with the GF writeout step
+        """
+        if 'last_voro_calc' in self.ctx:
+            return
+
+        return ToContext(last_voro_calc=self.submit_voroaux())
+
+
+    def submit_voroaux(self):
         """
         Perform a voronoi calculation for every impurity charge using the structure
-        from the converged KKR host calculation
+        from the converged KKR host calculation, returns the submitted workflow
         """
         # TODO: generalize to multiple impurities
 
@@ -403,12 +420,11 @@ class kkr_imp_wc(WorkChain):
             converged_host_remote = self.inputs.remote_data_host
         else:
             self.report('INFO: get converged host remote from GF_host_calc and graph to extract structure for Voronoi calculation')
-            remote_data_gf_node = load_node(self.inputs.remote_data_gf.pk)
-            GF_host_calc = remote_data_gf_node.get_incoming(link_label_filter=u'remote_folder').first().node
+            GF_host_calc = self.get_gf_host_calc_from_input()
             converged_host_remote = GF_host_calc.inputs.parent_folder
 
         # get previous kkr parameters following remote_folder->calc->parameters links
-        prev_kkrparams = converged_host_remote.get_incoming(link_label_filter='remote_folder').first().node.get_incoming(link_label_filter='parameters').first().node
+        prev_kkrparams = get_parent_paranode(converged_host_remote)
         calc_params = prev_kkrparams
 
         # set Fermi level for auxiliary impurity potential correctly (extract from EF that is used in impurity calc)
@@ -417,28 +433,32 @@ class kkr_imp_wc(WorkChain):
         # change voronoi parameters
         updatenode = Dict(dict={'ef_set': set_efermi, 'add_direct': True})
         updatenode.label = 'Added Fermi energy'
-        voro_params = update_params_wf(voro_params, updatenode)
+        # parameter updates are pure functions of their inputs and can be taken from the cache
+        with enable_caching():
+            voro_params = update_params_wf(voro_params, updatenode)
 
         # add or overwrite some parameters (e.g. things that are only used by voronoi)
         calc_params_dict = calc_params.get_dict()
         # add some voronoi specific parameters automatically if found (RMTREF should also set RMTCORE to the same value)
         if '<RMTREF>' in calc_params_dict.keys():
-            self.report('INFO: add rmtcore to voro params')
             self.ctx.change_voro_params['<RMTCORE>'] = calc_params_dict['<RMTREF>']
-            self.report(self.ctx.change_voro_params)
+            self.report('INFO: add rmtcore to voro params: {}'.format(self.ctx.change_voro_params))
         changed_params = False
         for key, val in self.ctx.change_voro_params.items():
             if key in ['RUNOPT', 'TESTOPT']:
                 opt_old = calc_params_dict.get(key, [])
                 if type(val)!=list: val = [val]
                 val = opt_old + val
-            calc_params_dict[key] = val
-            changed_params = True
+            # only create a new parameter node if something actually changes
+            if key not in calc_params_dict or calc_params_dict[key] != val:
+                calc_params_dict[key] = val
+                changed_params = True
         if changed_params:
             updatenode = Dict(dict=calc_params_dict)
             updatenode.label = 'Changed params for voroaux: {}'.format(self.ctx.change_voro_params.keys())
             updatenode.description = 'Overwritten voronoi input parameter from kkr_imp_wc input.'
-            calc_params = update_params_wf(calc_params, updatenode)
+            with enable_caching():
+                calc_params = update_params_wf(calc_params, updatenode)
 
         # find host structure
         structure_host, voro_calc = VoronoiCalculation.find_parent_structure(converged_host_remote)
@@ -446,10 +466,14 @@ class kkr_imp_wc(WorkChain):
         # for every impurity, generate a structure and launch the voronoi workflow
         # to get the auxiliary impurity startpotentials
         self.ctx.voro_calcs = {}
-        inter_struc = change_struc_imp_aux_wf(structure_host, imp_info)
-        sub_label = 'voroaux calc for Zimp: {} in host-struc'.format(imp_info.get_dict().get('Zimp'))
+        # the auxiliary structure only depends on host structure and impurity info,
+        # reuse the result of an identical previous call from the cache if possible
+        with enable_caching():
+            inter_struc = change_struc_imp_aux_wf(structure_host, imp_info)
+        zimp = imp_info.get_attribute('Zimp', None)
+        sub_label = 'voroaux calc for Zimp: {} in host-struc'.format(zimp)
         sub_description = 'Auxiliary voronoi calculation for an impurity with charge '
-        sub_description += '{} in the host structure from pid: {}'.format(imp_info.get_dict().get('Zimp'), converged_host_remote.pk)
+        sub_description += '{} in the host structure from pid: {}'.format(zimp, converged_host_remote.pk)
 
         builder = kkr_startpot_wc.get_builder()
         builder.metadata.label = sub_label
@@ -465,9 +489,9 @@ class kkr_imp_wc(WorkChain):
 
         tmp_calcname = 'voro_aux_{}'.format(1)
         self.ctx.voro_calcs[tmp_calcname] = future
-        self.report('INFO: running voro aux (Zimp= {}, pid: {})'.format(imp_info.get_dict().get('Zimp'), future.pk))
+        self.report('INFO: running voro aux (Zimp= {}, pid: {})'.format(zimp, future.pk))
 
-        return ToContext(last_voro_calc=future)
+        return future
 
 
     def get_ef_from_parent(self):
@@ -480,10 +504,13 @@ class kkr_imp_wc(WorkChain):
         elif 'remote_data_gf_Efshift' in self.inputs:
             parent_remote = load_node(self.inputs.remote_data_gf_Efshift.pk)
         else:
-            parent_remote = load_node(self.inputs.remote_data_gf.pk)
-        
+            parent_remote = None
+
         # now extract output parameters
-        parent_calc = parent_remote.get_incoming(link_label_filter='remote_folder').first().node
+        if parent_remote is None:
+            parent_calc = self.get_gf_host_calc_from_input()
+        else:
+            parent_calc = parent_remote.get_incoming(link_label_filter='remote_folder').first().node
         output_params = parent_calc.outputs.output_parameters.get_dict()
 
         # get fermi energy in Ry from output of KkrCalculation and return result
@@ -492,6 +519,16 @@ class kkr_imp_wc(WorkChain):
         return set_efermi
 
 
+    def get_gf_host_calc_from_input(self):
+        """
+        Return the GF writeout calculation of the remote_data_gf input node,
+        the result is stored in the context to avoid repeated graph traversals
+        """
+        if 'gf_host_calc_input' not in self.ctx:
+            self.ctx.gf_host_calc_input = get_parent_calc(self.inputs.remote_data_gf)
+        return self.ctx.gf_host_calc_input
+
+
     def construct_startpot(self):
         """
         Take the output of GF writeout and the converged host potential as well as the
@@ -502,13 +539,10 @@ class kkr_imp_wc(WorkChain):
         # collect all nodes necessary to construct the startpotential
         if self.ctx.do_gf_calc:
             GF_host_calc_pk = self.ctx.gf_writeout.outputs.workflow_info.get_dict().get('pk_flexcalc')
-            self.report('GF_host_calc_pk: {}'.format(GF_host_calc_pk))
             GF_host_calc = load_node(GF_host_calc_pk)
             converged_host_remote = self.inputs.remote_data_host
         else:
-            remote_data_gf_node = load_node(self.inputs.remote_data_gf.pk)
-            GF_host_calc = remote_data_gf_node.get_incoming(link_label_filter=u'remote_folder').first().node
-            self.report('GF_host_calc_pk: {}'.format(GF_host_calc.pk))
+            GF_host_calc = self.get_gf_host_calc_from_input()
             # follow parent_folder link up to get remote folder
             converged_host_remote = GF_host_calc.get_incoming(link_label_filter='parent_folder').first().node
         voro_calc_remote = self.ctx.last_voro_calc.outputs.last_voronoi_remote
@@ -526,10 +560,10 @@ class kkr_imp_wc(WorkChain):
             replacelist_pot2 = [[0,ilayer_cent]]
         else:
             replacelist_pot2 = [[0,2*ilayer_cent],[1,2*ilayer_cent+1]]
-        try:
-            neworder_pot1 = [int(i) for i in np.loadtxt(GF_host_calc.outputs.retrieved.open('scoef'), skiprows=1)[:,3]-1]
-        except:
-            neworder_pot1 = [int(np.loadtxt(GF_host_calc.outputs.retrieved.open('scoef'), skiprows=1)[3]-1)]
+        # read only the atom index column of scoef once (ndmin=1 also covers a single-atom cluster)
+        with GF_host_calc.outputs.retrieved.open('scoef') as scoef_file:
+            iatom_scoef = np.loadtxt(scoef_file, skiprows=1, usecols=(3,), ndmin=1)
+        neworder_pot1 = [int(i) for i in iatom_scoef-1]
 
         settings_label = 'startpot_KKRimp for imp_info node {}'.format(imp_info.pk)
         settings_description = 'starting potential for impurity info: {}'.format(imp_info)
@@ -601,29 +635,31 @@ class kkr_imp_wc(WorkChain):
 
         self.report('INFO: creating output nodes for the KKR impurity workflow ...')
 
-        if self.ctx.kkrimp_scf_sub.is_finished_ok:
-            last_calc_pk = self.ctx.kkrimp_scf_sub.outputs.workflow_info.get_dict().get('last_calc_nodeinfo')['pk']
-            last_calc_output_params = load_node(last_calc_pk).outputs.output_parameters
-            last_calc_info = self.ctx.kkrimp_scf_sub.outputs.workflow_info
+        kkrimp_scf_sub = self.ctx.kkrimp_scf_sub
+        if kkrimp_scf_sub.is_finished_ok:
+            last_calc_info = kkrimp_scf_sub.outputs.workflow_info
+            last_calc_info_dict = last_calc_info.get_dict()
+            last_calc = load_node(last_calc_info_dict.get('last_calc_nodeinfo')['pk'])
+            last_calc_output_params = last_calc.outputs.output_parameters
             outputnode_dict = {}
             outputnode_dict['workflow_name'] = self.__class__.__name__
             outputnode_dict['workflow_version'] = self._workflowversion
             if self.ctx.do_gf_calc:
                 outputnode_dict['used_subworkflows'] = {'gf_writeout': self.ctx.gf_writeout.pk,
-                                                        'kkr_imp_sub': self.ctx.kkrimp_scf_sub.pk}
+                                                        'kkr_imp_sub': kkrimp_scf_sub.pk}
                 outputnode_dict['gf_wc_success'] = self.ctx.gf_writeout.outputs.workflow_info.get_dict().get('successful')
             else:
-                outputnode_dict['used_subworkflows'] = {'kkr_imp_sub': self.ctx.kkrimp_scf_sub.pk}
+                outputnode_dict['used_subworkflows'] = {'kkr_imp_sub': kkrimp_scf_sub.pk}
             if self.ctx.create_startpot:
                 outputnode_dict['used_subworkflows']['auxiliary_voronoi'] = self.ctx.last_voro_calc.pk 
                 res_voro_info = self.ctx.last_voro_calc.outputs.results_vorostart_wc
                 outputnode_dict['voro_wc_success'] = res_voro_info.get_dict().get('successful')
-            outputnode_dict['converged'] = last_calc_info.get_dict().get('convergence_reached')
-            outputnode_dict['number_of_rms_steps'] = len(last_calc_info.get_dict().get('convergence_values_all_steps'))
-            outputnode_dict['convergence_values_all_steps'] = last_calc_info.get_dict().get('convergence_values_all_steps')
+            outputnode_dict['converged'] = last_calc_info_dict.get('convergence_reached')
+            outputnode_dict['number_of_rms_steps'] = len(last_calc_info_dict.get('convergence_values_all_steps'))
+            outputnode_dict['convergence_values_all_steps'] = last_calc_info_dict.get('convergence_values_all_steps')
             outputnode_dict['impurity_info'] = self.inputs.impurity_info.get_dict()
-            outputnode_dict['kkrimp_wc_success'] = last_calc_info.get_dict().get('successful')
-            outputnode_dict['last_calculation_uuid'] = load_node(last_calc_pk).uuid
+            outputnode_dict['kkrimp_wc_success'] = last_calc_info_dict.get('successful')
+            outputnode_dict['last_calculation_uuid'] = last_calc.uuid
             outputnode_t = Dict(dict=outputnode_dict)
             outputnode_t.label = 'kkrimp_wc_inform'
             outputnode_t.description = 'Contains information for workflow'
@@ -638,8 +674,8 @@ class kkr_imp_wc(WorkChain):
             self.final_cleanup()
             
             # print final message before exiting
-            self.report('INFO: created 3 output nodes for the KKR impurity workflow.')
-            self.report('\n'
+            self.report('INFO: created 3 output nodes for the KKR impurity workflow.\n'
+                        '\n'
                         '|------------------------------------------------------------------------------------------------------------------|\n'
                         '|-------------------------------------| Done with the KKR impurity workflow! |-------------------------------------|\n'
                         '|------------------------------------------------------------------------------------------------------------------|')
@@ -671,6 +707,9 @@ def change_struc_imp_aux_wf(struc, imp_info): # Note: works for single imp at ce
 
     new_struc = StructureData(cell=struc.cell)
     new_struc.pbc = struc.pbc # take also pbc values from parent struc
+    # read impurity info only once instead of for every site
+    ilayer_center = imp_info.get_attribute('ilayer_center', None)
+    zimp = imp_info.get_attribute('Zimp', None)
     isite = 0
     for site in struc.sites:
         sname = site.kind_name
@@ -682,8 +721,8 @@ def change_struc_imp_aux_wf(struc, imp_info): # Note: works for single imp at ce
             zatom = 0
         else:
             zatom = _atomic_numbers[kind.get_symbols_string()]
-        if isite == imp_info.get_dict().get('ilayer_center'):
-            zatom = imp_info.get_dict().get('Zimp')
+        if isite == ilayer_center:
+            zatom = zimp
             if type(zatom)==list:
               zatom = zatom[0] # here this works for single impurity only!
         symbol = PeriodicTableElements.get(zatom).get('symbol')
@@ -5,7 +5,7 @@ In this module you find the base workflow for a impurity DOS calculation and
 some helper methods to do so with AiiDA
 """
 from __future__ import print_function, absolute_import
-from aiida.orm import Code, load_node, CalcJobNode, Float, Int, Str
+from aiida.orm import Code, load_node, Float, Int, Str
 from aiida.plugins import DataFactory
 from aiida.engine import if_, ToContext, WorkChain, calcfunction
 from aiida.common import LinkType
@@ -14,7 +14,8 @@ from aiida_kkr.workflows.gf_writeout import kkr_flex_wc
 from aiida_kkr.workflows.kkr_imp_sub import kkr_imp_sub_wc
 from aiida_kkr.workflows.dos import kkr_dos_wc
 from aiida_kkr.calculations import KkrimpCalculation
-import tarfile
+from aiida_kkr.tools.common_workfunctions import get_parent_calc
+from masci_tools.io.common_functions import get_Ry2eV
 import os
 
 __copyright__ = (u"Copyright (c), 2019, Forschungszentrum Jülich GmbH, "
@@ -32,6 +33,9 @@ RemoteData = DataFactory('remote')
 SinglefileData = DataFactory('singlefile')
 XyData = DataFactory('array.xy')
 
+# conversion factor Ry -> eV (constant, evaluated once at import)
+_RY2EV = get_Ry2eV()
+
 
 class kkr_imp_dos_wc(WorkChain):
     """
@@ -227,7 +231,7 @@ class kkr_imp_dos_wc(WorkChain):
 
         if 'imp_pot_sfd' in inputs:
             # check if input potential has incoming return link
-            if len(inputs.imp_pot_sfd.get_incoming(link_type=LinkType.RETURN).all()) < 1:
+            if inputs.imp_pot_sfd.get_incoming(link_type=LinkType.RETURN).first() is None:
                 self.report("input potential not from kkrimp workflow: take remote_data folder of host system from input")
                 if 'impurity_info' in inputs and 'host_remote' in inputs:
                     self.ctx.imp_info = inputs.impurity_info
@@ -248,17 +252,20 @@ class kkr_imp_dos_wc(WorkChain):
                 self.ctx.kkr_imp_wf = inputs.imp_pot_sfd.get_incoming().first().node
                 self.report('INFO: found underlying kkr impurity workflow '
                             '(pk: {})'.format(self.ctx.kkr_imp_wf.pk))
-                self.ctx.imp_info = self.ctx.kkr_imp_wf.inputs.impurity_info
+                # collect all input nodes of the workflow with a single query
+                kkr_imp_wf_inputs = {link.link_label: link.node for link in
+                                     self.ctx.kkr_imp_wf.get_incoming().all()}
+                self.ctx.imp_info = kkr_imp_wf_inputs['impurity_info']
                 self.report('INFO: found impurity_info node (pk: {})'.format(
                             self.ctx.imp_info.pk))
-                if 'remote_data' in self.ctx.kkr_imp_wf.inputs:
-                    remote_data_gf_writeout = self.ctx.kkr_imp_wf.inputs.remote_data
-                    gf_writeout_calc = remote_data_gf_writeout.get_incoming(node_class=CalcJobNode).first().node
+                if 'remote_data' in kkr_imp_wf_inputs:
+                    remote_data_gf_writeout = kkr_imp_wf_inputs['remote_data']
+                    gf_writeout_calc = get_parent_calc(remote_data_gf_writeout)
                     self.ctx.conv_host_remote = gf_writeout_calc.inputs.parent_folder
                     self.report('INFO: imported converged_host_remote (pk: {}) and '
                                 'impurity_info from database'.format(self.ctx.conv_host_remote.pk))
                 else:
-                    self.ctx.conv_host_remote = self.ctx.kkr_imp_wf.inputs.gf_remote.inputs.remote_folder.inputs.parent_calc_folder.inputs.remote_folder.outputs.remote_folder
+                    self.ctx.conv_host_remote = kkr_imp_wf_inputs['gf_remote'].inputs.remote_folder.inputs.parent_calc_folder.inputs.remote_folder.outputs.remote_folder
                     self.report('INFO: imported converged_host_remote (pk: {}) and '
                                 'impurity_info from database'.format(self.ctx.conv_host_remote.pk))
 
@@ -285,7 +292,7 @@ class kkr_imp_dos_wc(WorkChain):
         elif 'kkrimp_remote' in self.inputs:
             self.report("[INFO] use `kkrimp_remote` input node")
             # extract imp_info node from parent KKRimp calculation
-            parent_impcalc = self.inputs.kkrimp_remote.get_incoming(node_class=CalcJobNode).first().node
+            parent_impcalc = get_parent_calc(self.inputs.kkrimp_remote)
             self.ctx.imp_info = parent_impcalc.inputs.impurity_info
         else:
             self.report("neither `imp_pot_sfd` nor `kkrimp_remote` node in inputs")
@@ -347,7 +354,7 @@ class kkr_imp_dos_wc(WorkChain):
         else:
             # use gf_writeout from input
             gf_writeout_remote = self.inputs.gf_dos_remote
-            gf_writeout_calc = gf_writeout_remote.get_incoming(node_class=CalcJobNode).first().node
+            gf_writeout_calc = get_parent_calc(gf_writeout_remote)
             self.ctx.pk_flexcalc = gf_writeout_calc.pk
             
 
@@ -480,6 +487,7 @@ class kkr_imp_dos_wc(WorkChain):
         if KkrimpCalculation._FILENAME_TAR in dos_retrieved.list_object_names():
             # deal with packed output files (overwrites dos_retrieved with sandbox into which files are extracted
             # this way the unpacked files are deleted after parsing and only the tarball is kept in the retrieved directory
+            import tarfile
 
             # for this we create a Sandbox folder
             with SandboxFolder() as tempfolder:
@@ -494,10 +502,9 @@ class kkr_imp_dos_wc(WorkChain):
 
                 # extract file from tarfile of retrieved to tempfolder
                 with tarfile.open(tfpath) as tf:
-                    tar_filenames = [ifile.name for ifile in tf.getmembers()]
-                    for filename in tar_filenames:
-                        if 'dos' in filename: # should extract all out_ldos*, out_lmdos* files
-                            tf.extract(filename, tempfolder_path) # extract to tempfolder
+                    for member in tf.getmembers():
+                        if 'dos' in member.name: # should extract all out_ldos*, out_lmdos* files
+                            KkrimpCalculation._extract_from_tar(tf, member, tempfolder_path) # extract to tempfolder
 
                 # now files are in tempfolder from where we can extract the dos data
                 dos_extracted, dosXyDatas = self.extract_dos_data_from_folder(tempfolder, last_calc)
@@ -530,7 +537,7 @@ class kkr_imp_dos_wc(WorkChain):
         if 'out_ldos.interpol.atom=01_spin1.dat' in filelist:
             # extract EF and number of atoms from kkrflex_writeout calculation
             kkrflex_writeout = load_node(self.ctx.pk_flexcalc)
-            parent_calc_kkr_converged = kkrflex_writeout.inputs.parent_folder.get_incoming(node_class=CalcJobNode).first().node
+            parent_calc_kkr_converged = get_parent_calc(kkrflex_writeout.inputs.parent_folder)
             ef = parent_calc_kkr_converged.outputs.output_parameters.get_dict().get('fermi_energy')
             last_calc_output_params = last_calc.outputs.output_parameters
             natom = last_calc_output_params.get_dict().get('number_of_atoms_in_unit_cell')
@@ -560,7 +567,6 @@ def parse_impdosfiles(dos_abspath, natom, nspin, ef):
       output = {'dos_data': dosnode, 'dos_data_interpol': dosnode2}
     where `dosnode` and `dosnode2` are AiiDA XyData objects
     """
-    from masci_tools.io.common_functions import get_Ry2eV, get_ef_from_potfile
     from numpy import loadtxt, array
 
     # add '/' if missing from path
@@ -579,12 +585,12 @@ def parse_impdosfiles(dos_abspath, natom, nspin, ef):
                 dos_int.append(tmp)
     dos, dos_int = array(dos), array(dos_int)
 
-    # convert to eV units
-    eVscale = get_Ry2eV()
-    dos[:,:,0] = (dos[:,:,0]-ef.value)*eVscale
-    dos[:,:,1:] = dos[:,:,1:]/eVscale
-    dos_int[:,:,0] = (dos_int[:,:,0]-ef.value)*eVscale
-    dos_int[:,:,1:] = dos_int[:,:,1:]/eVscale
+    # convert to eV units (in place to avoid temporary arrays)
+    eVscale = _RY2EV
+    for dos_array in (dos, dos_int):
+        dos_array[:,:,0] -= ef.value
+        dos_array[:,:,0] *= eVscale
+        dos_array[:,:,1:] /= eVscale
 
     # create output nodes
     dosnode = XyData()
@@ -595,24 +601,14 @@ def parse_impdosfiles(dos_abspath, natom, nspin, ef):
     name = ['tot', 's', 'p', 'd', 'f', 'g']
     name = name[:len(dos[0,0,1:])-1]+['ns']
 
-    ylists = [[],[],[]]
-    for l in range(len(name)):
-        ylists[0].append(dos[:,:,1+l])
-        ylists[1].append('dos '+name[l])
-        ylists[2].append('states/eV')
-    dosnode.set_y(ylists[0], ylists[1], ylists[2])
+    dosnode.set_y([dos[:,:,1+l] for l in range(len(name))], ['dos '+n for n in name], ['states/eV']*len(name))
 
     # node for interpolated DOS
     dosnode2 = XyData()
     dosnode2.label = 'dos_interpol_data'
     dosnode2.description = 'Array data containing iterpolated DOS (i.e. dos at finite imaginary part of energy). 3D array with (atoms, energy point, l-channel) dimensions.'
     dosnode2.set_x(dos_int[:,:,0], 'E-EF', 'eV')
-    ylists = [[],[],[]]
-    for l in range(len(name)):
-        ylists[0].append(dos_int[:,:,1+l])
-        ylists[1].append('interpolated dos '+name[l])
-        ylists[2].append('states/eV')
-    dosnode2.set_y(ylists[0], ylists[1], ylists[2])
+    dosnode2.set_y([dos_int[:,:,1+l] for l in range(len(name))], ['interpolated dos '+n for n in name], ['states/eV']*len(name))
 
     output = {'dos_data': dosnode, 'dos_data_interpol': dosnode2}
 
@@ -623,9 +619,6 @@ def cleanup_kkrimp_retrieved(pk_impcalc):
     """
     remove output_all.tar.gz from retrieved of impurity calculation identified by pk_impcalc
     """
-    from aiida.orm import load_node
-    from aiida_kkr.calculations import KkrimpCalculation
-
     # extract retrieved folder
     doscalc = load_node(pk_impcalc)
     ret = doscalc.outputs.retrieved
@@ -7,14 +7,14 @@ from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
 from aiida.plugins import DataFactory
-from aiida.orm import Float, Code, CalcJobNode
+from aiida.orm import Float, Code
 from aiida.engine import WorkChain, ToContext, while_, if_
 from masci_tools.io.kkr_params import kkrparams
-from aiida_kkr.tools.common_workfunctions import test_and_get_codenode, get_inputs_kkrimp, kick_out_corestates_wf
+from aiida_kkr.tools.common_workfunctions import test_and_get_codenode, get_inputs_kkrimp, kick_out_corestates_wf, get_parent_calc
 from aiida_kkr.calculations.kkrimp import KkrimpCalculation
 from numpy import array
 from six.moves import range
-import tarfile, os
+import io, tarfile, os
 
 
 __copyright__ = (u"Copyright (c), 2017, Forschungszentrum Jülich GmbH, "
@@ -470,7 +470,7 @@ class kkr_imp_sub_wc(WorkChain):
             last_rms = self.ctx.last_rms_all[-1]
 
         # extract values from host calculation
-        host_GF_calc = self.inputs.remote_data.get_incoming(node_class=CalcJobNode).first().node
+        host_GF_calc = get_parent_calc(self.inputs.remote_data)
         host_GF_outparams = host_GF_calc.outputs.output_parameters.get_dict()
         host_GF_inparams = host_GF_calc.inputs.parameters.get_dict()
         nspin = host_GF_outparams.get('nspin')
@@ -633,15 +633,17 @@ class kkr_imp_sub_wc(WorkChain):
             # step 3:
             self.report("INFO: update parameters to: {}".format(para_check.get_set_values()))
 
-            #test
-            self.ctx.last_params = Dict(dict={})
-
-            updatenode = Dict(dict=para_check.get_dict())
-            updatenode.label = label
-            updatenode.description = description
+            # reuse the previous parameter node if nothing changed (avoids storing a duplicate node)
+            new_param_dict = para_check.get_dict()
+            if self.ctx.last_params is not None and self.ctx.last_params.get_dict() == new_param_dict:
+                self.report("INFO: parameters did not change, reuse parameter node (pk: {})".format(self.ctx.last_params.pk))
+            else:
+                updatenode = Dict(dict=new_param_dict)
+                updatenode.label = label
+                updatenode.description = description
 
-            paranode_new = updatenode #update_params_wf(self.ctx.last_params, updatenode)
-            self.ctx.last_params = paranode_new
+                paranode_new = updatenode #update_params_wf(self.ctx.last_params, updatenode)
+                self.ctx.last_params = paranode_new
         else:
             self.report("INFO: reuse old settings")
 
@@ -685,7 +687,7 @@ class kkr_imp_sub_wc(WorkChain):
             if 'impurity_info' in self.inputs:
                 self.report('INFO: using impurity_info node as input for kkrimp calculation')
                 imp_info = self.inputs.impurity_info
-                label = 'KKRimp calculation step {} (IMIX={}, Zimp: {})'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme, imp_info.get_dict().get('Zimp'))
+                label = 'KKRimp calculation step {} (IMIX={}, Zimp: {})'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme, imp_info.get_attribute('Zimp', None))
                 description = 'KKRimp calculation of step {}, using mixing scheme {}'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme)
                 inputs = get_inputs_kkrimp(code, options, label, description, params,
                                            not self.ctx.use_mpi, imp_info=imp_info, host_GF=host_GF, imp_pot=imp_pot, host_GF_Efshift=host_GF_Efshift)
@@ -700,7 +702,7 @@ class kkr_imp_sub_wc(WorkChain):
             if 'impurity_info' in self.inputs:
                 self.report('INFO: using RemoteData from previous kkrimp calculation and impurity_info node as input')
                 imp_info = self.inputs.impurity_info
-                label = 'KKRimp calculation step {} (IMIX={}, Zimp: {})'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme, imp_info.get_dict().get('Zimp'))
+                label = 'KKRimp calculation step {} (IMIX={}, Zimp: {})'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme, imp_info.get_attribute('Zimp', None))
                 description = 'KKRimp calculation of step {}, using mixing scheme {}'.format(self.ctx.loop_count, self.ctx.last_mixing_scheme)
                 inputs = get_inputs_kkrimp(code, options, label, description, params,
                                            not self.ctx.use_mpi, imp_info=imp_info, host_GF=host_GF, kkrimp_remote=last_remote, host_GF_Efshift=host_GF_Efshift)
@@ -739,17 +741,16 @@ class kkr_imp_sub_wc(WorkChain):
         try:
             retrieved_folder = self.ctx.kkr.outputs.retrieved
             if KkrimpCalculation._FILENAME_TAR in retrieved_folder.list_object_names():
-                # take potfile after extracting tar file
+                # take potfile from tar file
                 # get full filename
                 with retrieved_folder.open(KkrimpCalculation._FILENAME_TAR) as tar_file:
                     tarfilename = tar_file.name
-                # open tarfile and extract potfile
+                # open tarfile and read potfile directly from the archive (no extraction to disk)
                 with tarfile.open(tarfilename) as tar_file:
-                    tar_file.extract(KkrimpCalculation._OUT_POTENTIAL, os.path.dirname(tarfilename))
-                    with retrieved_folder.open(KkrimpCalculation._OUT_POTENTIAL, 'rb') as pot_file:
-                        self.ctx.last_pot = SinglefileData(file=pot_file)
-                    # delete extracted potfile again
-                    retrieved_folder.delete_object(KkrimpCalculation._OUT_POTENTIAL, force=True)
+                    pot_file = io.BytesIO(tar_file.extractfile(KkrimpCalculation._OUT_POTENTIAL).read())
+                # name is used as filename of the SinglefileData
+                pot_file.name = KkrimpCalculation._OUT_POTENTIAL
+                self.ctx.last_pot = SinglefileData(file=pot_file)
             else:
                 # take potfile directly from output
                 with retrieved_folder.open(KkrimpCalculation._OUT_POTENTIAL, 'rb') as pot_file:
@@ -807,7 +808,7 @@ class kkr_imp_sub_wc(WorkChain):
         tmplist.append(self.ctx.kkr_step_success)
         self.ctx.KKR_steps_stats['success'] = tmplist
         try:
-            isteps = self.ctx.last_calc.outputs.output_parameters.get_dict()['convergence_group']['number_of_iterations']
+            isteps = self.ctx.last_calc.outputs.output_parameters.get_attribute('convergence_group')['number_of_iterations']
         except:
             self.ctx.warnings.append('cound not set isteps in KKR_steps_stats dict')
             isteps = -1
@@ -852,7 +853,7 @@ class kkr_imp_sub_wc(WorkChain):
 
         # first check if previous calculation was stopped due to reaching the QBOUND limit
         try:
-            calc_reached_qbound = self.ctx.last_calc.outputs.output_parameters.get_dict()['convergence_group']['calculation_converged']
+            calc_reached_qbound = self.ctx.last_calc.outputs.output_parameters.get_attribute('convergence_group')['calculation_converged']
         except AttributeError: # captures error when last_calc dies not have an output node
             calc_reached_qbound = False
         except KeyError: # captures
@@ -1054,10 +1055,9 @@ def remove_out_pot_impcalcs(successful, pks_all_calcs, dry_run=False):
         successful = imp_scf_wf.outputs.workflow_info['successful']
         pks_all_calcs = imp_scf_wf.outputs.workflow_info['pks_all_calcs']
     """
-    import tarfile, os
+    import tarfile
     from aiida.orm import load_node
     from aiida.common.folders import SandboxFolder
-    from aiida_kkr.calculations import KkrimpCalculation
     
     if dry_run:
         print('test', successful, len(pks_all_calcs))
@@ -1092,7 +1092,8 @@ def remove_out_pot_impcalcs(successful, pks_all_calcs, dry_run=False):
                     tar_filenames = [ifile.name for ifile in tf.getmembers()]
                     # check if out_potential is in tarfile
                     if KkrimpCalculation._OUT_POTENTIAL in tar_filenames:
-                        tf.extractall(tmpfolder_path)
+                        for member in tf.getmembers():
+                            KkrimpCalculation._extract_from_tar(tf, member, tmpfolder_path)
                         delete_and_retar = True
 
                 if delete_and_retar and not dry_run:
@@ -1121,7 +1122,6 @@ def clean_raw_input(successful, pks_calcs, dry_run=False):
     for the calculations of a successfully finished workflow (see email on mailing list from 25.11.2019).
     """
     from aiida.orm import load_node
-    from aiida_kkr.calculations import KkrimpCalculation
     if successful:
         for pk in pks_calcs:
             node = load_node(pk)
@@ -948,7 +948,7 @@ class kkr_scf_wc(WorkChain):
         tmplist.append(self.ctx.kkr_step_success)
         self.ctx.KKR_steps_stats['success'] = tmplist
         try:
-            isteps = self.ctx.last_calc.outputs.output_parameters.get_dict()['convergence_group']['number_of_iterations']
+            isteps = self.ctx.last_calc.outputs.output_parameters.get_attribute('convergence_group')['number_of_iterations']
         except:
             self.ctx.warnings.append('cound not set isteps in KKR_steps_stats dict')
             isteps = -1
@@ -1000,7 +1000,7 @@ class kkr_scf_wc(WorkChain):
 
         # first check if previous calculation was stopped due to reaching the QBOUND limit
         try:
-            calc_reached_qbound = self.ctx.last_calc.outputs.output_parameters.get_dict()['convergence_group']['calculation_converged']
+            calc_reached_qbound = self.ctx.last_calc.outputs.output_parameters.get_attribute('convergence_group')['calculation_converged']
         except: # captures error when last_calc dies not have an output node
             calc_reached_qbound = False
 